@@ -136,7 +136,13 @@ function rmvenv() {
     fi
 
     # Call the robust Python script to handle the validation and deletion.
-    rmvenv.py
+    # Without a terminal on stdin there is nobody to answer the prompt, so
+    # confirmation is skipped.
+    if [ -t 0 ]; then
+        rmvenv.py "$@"
+    else
+        rmvenv.py -y "$@"
+    fi
 }
 
 # ------------------------------------------------------------------------------
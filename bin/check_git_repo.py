@@ -5,15 +5,9 @@
 import argparse
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
-try:
-    from git_tools import git_operations
-    from git_tools.exceptions import GitToolsError
-    from git_tools.models import RepoStatus
-except ImportError:
-    sys.path.insert(0, str(Path(__file__).resolve().parent))
-    from git_tools import git_operations
-    from git_tools.exceptions import GitToolsError
+if TYPE_CHECKING:
     from git_tools.models import RepoStatus
 
 # --- ANSI Colour Codes ---
@@ -25,27 +19,58 @@ class Colors:
     GRAY = "\033[90m"
     ENDC = "\033[0m"
 
-def _print_status(status: RepoStatus):
-    """Formats and prints the repository status to the console."""
+# Escape codes are only useful on a terminal; when piped, they are blanked
+# once here so every format string below emits plain text.
+if not sys.stdout.isatty():
+    for _name in ("GREEN", "YELLOW", "RED", "BLUE", "GRAY", "ENDC"):
+        setattr(Colors, _name, "")
+
+# Each coloured summary is built once here rather than for every repository.
+SUMMARIES = {
+    "messy": f"{Colors.YELLOW}* Messy{Colors.ENDC}",
+    "diverged": f"{Colors.RED}↔Diverged{Colors.ENDC}",
+    "ahead": f"{Colors.YELLOW}↑Ahead{Colors.ENDC}",
+    "behind": f"{Colors.YELLOW}↓Behind{Colors.ENDC}",
+    "no_remote": f"{Colors.GRAY}- No Remote{Colors.ENDC}",
+    "synced": f"{Colors.GREEN}●Synced{Colors.ENDC}",
+}
+
+def _summary_key(status: "RepoStatus") -> str:
+    """Picks the most important condition of a repository, in priority order."""
+    if status.is_messy:
+        return "messy"
+    if status.ahead_count > 0 and status.behind_count > 0:
+        return "diverged"
+    if status.ahead_count > 0:
+        return "ahead"
+    if status.behind_count > 0:
+        return "behind"
+    if not status.remote_url:
+        return "no_remote"
+    return "synced"
+
+def _print_status(status: "RepoStatus", header: Optional[Path] = None):
+    """Formats and prints the repository status to the console.
+
+    When a header path is given (multi-repo mode), it is printed above the
+    summary so that each block can be attributed to its repository.
+    """
+    if header is not None:
+        print(f"\n{Colors.BLUE}=== {header} ==={Colors.ENDC}")
+
     if not status.is_repo:
         print(f"{Colors.RED}Error: Not a Git repository.{Colors.ENDC}")
         return
 
-    # --- 1. The High-Level Summary Line ---
-    summary = ""
-    if status.is_messy:
-        summary = f"{Colors.YELLOW}* Messy{Colors.ENDC}"
-    elif status.ahead_count > 0 and status.behind_count > 0:
-        summary = f"{Colors.RED}↔Diverged{Colors.ENDC}"
-    elif status.ahead_count > 0:
-        summary = f"{Colors.YELLOW}↑Ahead{Colors.ENDC}"
-    elif status.behind_count > 0:
-        summary = f"{Colors.YELLOW}↓Behind{Colors.ENDC}"
-    elif not status.remote_url:
-        summary = f"{Colors.GRAY}- No Remote{Colors.ENDC}"
-    else:
-        summary = f"{Colors.GREEN}●Synced{Colors.ENDC}"
+    if status.error:
+        print(f"{Colors.RED}Error: An operation failed:\n{status.error}{Colors.ENDC}")
+        return
 
+    if status.fetched:
+        print("Fetched from remote.")
+
+    # --- 1. The High-Level Summary Line ---
+    summary = SUMMARIES[_summary_key(status)]
     print(f"\nStatus: {summary}")
     print("-" * 40)
 
@@ -74,23 +99,40 @@ def _print_status(status: RepoStatus):
 def main() -> None:
     """Parses arguments and orchestrates the status check."""
     parser = argparse.ArgumentParser(
-        description="Check the status of a Git repository against its remote."
+        description="Check the status of one or more Git repositories against their remotes."
     )
     parser.add_argument(
-        "path",
-        nargs="?",
-        default=".",
-        help="Optional path to the Git repository. Defaults to the current directory."
+        "paths",
+        nargs="*",
+        default=["."],
+        help="Optional paths to Git repositories. Defaults to the current directory."
+    )
+    parser.add_argument(
+        "--no-fetch",
+        action="store_true",
+        help="Compare against the last fetched remote state instead of fetching first."
     )
     args = parser.parse_args()
 
-    repo_path = Path(args.path).resolve()
-
+    # The library is only imported once the arguments are known to be valid,
+    # so '--help' and usage errors return without loading it.
     try:
-        status = git_operations.get_repo_status(repo_path)
-        _print_status(status)
-    except GitToolsError as e:
-        print(f"\n{Colors.RED}Error: An operation failed:\n{e}{Colors.ENDC}", file=sys.stderr)
+        from git_tools import git_operations
+    except ImportError:
+        sys.path.insert(0, str(Path(__file__).resolve().parent))
+        from git_tools import git_operations
+
+    repo_paths = [Path(p).resolve() for p in args.paths]
+    statuses = git_operations.get_repo_statuses(repo_paths, do_fetch=not args.no_fetch)
+
+    # Print in input order so the output is deterministic. A failed
+    # repository is reported in its own block, after which the rest are still
+    # shown.
+    show_header = len(repo_paths) > 1
+    for path in repo_paths:
+        _print_status(statuses[path], header=path if show_header else None)
+
+    if any(status.error for status in statuses.values()):
         sys.exit(1)
 
 
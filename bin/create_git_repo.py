@@ -8,20 +8,6 @@
 import sys
 from pathlib import Path
 
-# It's good practice to add the project root to the path if running scripts directly
-# This makes imports more reliable.
-try:
-    from git_tools import git_operations, github_api
-    from git_tools.config import GITHUB_USERNAME
-    from git_tools.exceptions import GitToolsError
-except ImportError:
-    # This block allows the script to be run from the root directory
-    # without having to install the package.
-    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-    from git_tools import git_operations, github_api
-    from git_tools.config import GITHUB_USERNAME
-    from git_tools.exceptions import GitToolsError
-
 
 def main() -> None:
     """
@@ -34,18 +20,33 @@ def main() -> None:
     repo_name = sys.argv[1]
     repo_path = Path.cwd() / repo_name
 
+    # The library is only imported once the arguments are known to be valid,
+    # so usage errors return without loading it.
+    try:
+        from git_tools import git_operations
+        from git_tools.exceptions import GitToolsError
+    except ImportError:
+        # This block allows the script to be run from the root directory
+        # without having to install the package.
+        sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+        from git_tools import git_operations
+        from git_tools.exceptions import GitToolsError
+
     try:
         # Step 1: Set up the local repository
         git_operations.initialize_local_repo(repo_path, repo_name)
 
-        # Step 2: Create the remote repository on GitHub
+        # Step 2: Create the remote repository on GitHub, only once the local
+        # one exists, so a local failure never leaves an orphaned remote
+        from git_tools import config, github_api
         github_api.create_github_repo(repo_name)
 
         # Step 3: Create an initial commit if needed
         if git_operations.create_initial_commit(repo_path):
             # Step 4: Link the local and remote repos and push
-            git_operations.set_remote_origin(repo_path, GITHUB_USERNAME, repo_name)
-            git_operations.push_to_origin(repo_path)
+            git_operations.set_remote_origin(repo_path, config.get_github_username(), repo_name)
+            branch = git_operations.get_current_branch(repo_path)
+            git_operations.push_to_origin(repo_path, branch)
         else:
             print("Skipping push because there are no new commits to send.")
 
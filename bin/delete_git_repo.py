@@ -3,31 +3,57 @@
 # Deletes a Git repository from both the local system and GitHub.
 # -----------------------------------------------------------------------------
 import sys
-import shutil
+import asyncio
+import argparse
 from pathlib import Path
 
-try:
-    from git_tools import git_operations, github_api, validation
-    from git_tools.exceptions import GitToolsError
-except ImportError:
-    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-    from git_tools import git_operations, github_api, validation
-    from git_tools.exceptions import GitToolsError
+
+async def _delete_concurrently(owner: str, repo_name: str, local_repo_path: Path) -> None:
+    """Deletes the remote repository and the local directory at the same time."""
+    from git_tools import github_api, utils
+
+    loop = asyncio.get_running_loop()
+    # Both jobs always run to completion, so a failure on one side is
+    # reported only after the other side has finished as well.
+    results = await asyncio.gather(
+        loop.run_in_executor(None, github_api.delete_github_repo, owner, repo_name),
+        loop.run_in_executor(None, utils.parallel_rmtree, local_repo_path),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
 
 
 def main() -> None:
     """Orchestrates the repository deletion process."""
-    if len(sys.argv) != 2:
-        print(f"Usage: {sys.argv[0]} <local_repo_directory_name>", file=sys.stderr)
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="Delete a Git repository locally and on GitHub."
+    )
+    parser.add_argument("repo_dir_name", help="The local repository directory name.")
+    parser.add_argument(
+        "--force-parallel",
+        action="store_true",
+        help="Delete the local directory without waiting for GitHub to confirm.",
+    )
+    args = parser.parse_args()
 
-    repo_dir_name = sys.argv[1]
-    local_repo_path = Path.cwd() / repo_dir_name
+    local_repo_path = Path.cwd() / args.repo_dir_name
 
     if not local_repo_path.is_dir():
         print(f"Error: The directory '{local_repo_path}' does not exist.", file=sys.stderr)
         sys.exit(1)
 
+    # The library is only imported once the arguments are known to be valid,
+    # so '--help' and usage errors return without loading it.
+    try:
+        from git_tools import git_operations, validation
+        from git_tools.exceptions import GitToolsError
+    except ImportError:
+        sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+        from git_tools import git_operations, validation
+        from git_tools.exceptions import GitToolsError
+
     try:
         # Step 1: Get remote URL and parse it
         remote_url = git_operations.get_remote_url(local_repo_path)
@@ -54,13 +80,21 @@ def main() -> None:
             print("Deletion aborted.")
             return
 
-        # Step 3: Delete remote repository first
-        github_api.delete_github_repo(owner, repo_name)
+        # Only load the GitHub client once the user has confirmed the deletion
+        from git_tools import github_api, utils
+
+        if args.force_parallel:
+            # Step 3: Overlap the GitHub round-trip with the local deletion
+            print(f"Deleting '{owner}/{repo_name}' and '{local_repo_path}' in parallel...")
+            asyncio.run(_delete_concurrently(owner, repo_name, local_repo_path))
+        else:
+            # Step 3: Delete remote repository first
+            github_api.delete_github_repo(owner, repo_name)
 
-        # Step 4: If remote deletion succeeds, delete local directory
-        print(f"Deleting local directory: {local_repo_path}...")
-        shutil.rmtree(local_repo_path)
-        print(f"Successfully deleted local directory.")
+            # Step 4: If remote deletion succeeds, delete local directory
+            print(f"Deleting local directory: {local_repo_path}...")
+            utils.parallel_rmtree(local_repo_path)
+            print(f"Successfully deleted local directory.")
 
         print(f"\n✅ Successfully deleted '{repo_name}'.")
 
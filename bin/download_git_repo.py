@@ -2,45 +2,56 @@
 # -----------------------------------------------------------------------------
 # Clones one of your own repositories from GitHub.
 # -----------------------------------------------------------------------------
+import os
 import sys
 from pathlib import Path
 
-try:
-    from git_tools import git_operations, config
-    from git_tools.exceptions import GitToolsError, ConfigurationError
-    from git_tools.logging_config import setup_logging
-
-except ImportError:
-    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-    from git_tools import git_operations, config
-    from git_tools.exceptions import GitToolsError, ConfigurationError
-    from git_tools.logging_config import setup_logging
-
 
 def main() -> None:
     """Parses arguments and orchestrates the clone operation."""
-    setup_logging()
     if len(sys.argv) != 2:
         print(f"Usage: {sys.argv[0]} <repo-name>", file=sys.stderr)
         sys.exit(1)
 
-    repo_name = sys.argv[1]
-    
+    # The library is only imported once the arguments are known to be valid,
+    # so usage errors return without loading it.
+    try:
+        from git_tools import config, validation
+        from git_tools.exceptions import GitToolsError, ConfigurationError
+        from git_tools.logging_config import setup_logging
+    except ImportError:
+        sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+        from git_tools import config, validation
+        from git_tools.exceptions import GitToolsError, ConfigurationError
+        from git_tools.logging_config import setup_logging
+    setup_logging()
+
+    owner, repo_name = validation.parse_repo_argument(sys.argv[1])
+    if not validation.validate_repo_name(repo_name):
+        sys.exit(1)
+
     if Path(repo_name).exists():
         print(f"Error: A file or directory named '{repo_name}' already exists.", file=sys.stderr)
         sys.exit(1)
 
     try:
-        username = config.get_github_username()
-        clone_url = f"git@github.com:{username}/{repo_name}.git"
-        print(f"Cloning '{clone_url}'...")
-        # We don't use the quiet flag here so the user can see git's output
-        git_operations.run_git_command(["clone", clone_url])
-        print(f"\n✅ Successfully cloned '{repo_name}'.")
+        # A repository given as 'owner/repo' or a URL names its own owner.
+        owner = owner or config.get_github_username()
+        clone_url = f"git@github.com:{owner}/{repo_name}.git"
+        print(f"Cloning '{clone_url}'...", flush=True)
+        # Nothing is left to do after the clone, so git replaces this process
+        # instead of running as its child. Its progress goes straight to the
+        # terminal, and its exit status becomes the script's.
+        os.execvp("git", ["git", "clone", clone_url])
 
     except (GitToolsError, ConfigurationError) as e:
         print(f"\nError: Clone operation failed.\n{e}", file=sys.stderr)
         sys.exit(1)
 
+    except OSError as e:
+        print(f"\nError: Could not run 'git'. Is Git installed and in your PATH?\n{e}",
+              file=sys.stderr)
+        sys.exit(1)
+
 if __name__ == "__main__":
     main()
@@ -1,27 +1,209 @@
 #!/usr/bin/env python3
 import os
+import re
+import sys
+import json
+import mmap
+import fnmatch
 import argparse
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+# Files are handed to worker processes in batches to amortise pickling cost.
+CHUNK_SIZE = 64
+
+
+def _replaced_chunks(mm, find_bytes, replace_bytes, first):
+    """Yields the mapped file's contents with every occurrence replaced."""
+    pos = 0
+    index = first
+    while index != -1:
+        yield mm[pos:index]
+        yield replace_bytes
+        pos = index + len(find_bytes)
+        index = mm.find(find_bytes, pos)
+    yield mm[pos:]
+
+
+def _atomic_write(filepath, chunks):
+    """Writes chunks to a temporary file next to the target, then swaps it in."""
+    directory = os.path.dirname(filepath) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".find_replace.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.writelines(chunks)
+        os.chmod(tmp_path, os.stat(filepath).st_mode)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _scan_and_replace(filepath, find_bytes, replace_bytes):
+    """Replaces all occurrences in one file, returning True if it was changed."""
+    # The file is scanned through a read-only memory map, and the same map
+    # feeds the rewrite, so matching files are never read into memory whole
+    # and non-matching ones are never copied at all.
+    if not find_bytes:
+        # An empty needle matches at every offset and would never advance.
+        raise ValueError("the text to find must not be empty")
+    fd = os.open(filepath, os.O_RDONLY)
+    try:
+        try:
+            mm = mmap.mmap(fd, 0, prot=mmap.PROT_READ)
+        except ValueError:
+            # Empty files cannot be mapped, and cannot contain the needle either.
+            return False
+        with mm:
+            first = mm.find(find_bytes)
+            if first == -1:
+                return False
+            _atomic_write(filepath, _replaced_chunks(mm, find_bytes, replace_bytes, first))
+            return True
+    finally:
+        os.close(fd)
+
+
+def _build_automaton(pairs):
+    """Builds an Aho-Corasick automaton over all find strings."""
+    try:
+        import ahocorasick
+    except ImportError:
+        print("Error: The 'pyahocorasick' library is required for --map. "
+              "Please install it with 'pip install pyahocorasick'.")
+        sys.exit(1)
+
+    automaton = ahocorasick.Automaton()
+    for find, replace in pairs:
+        automaton.add_word(find, (find, replace))
+    automaton.make_automaton()
+    return automaton
+
+
+def _replace_many(text, automaton):
+    """Applies all replacements in one scan, preferring leftmost-longest matches."""
+    # The automaton reports every match by end index; keep the earliest
+    # starting one at each position (longest on ties) and skip overlaps.
+    matches = sorted(
+        ((end - len(find) + 1, -len(find), replace)
+         for end, (find, replace) in automaton.iter(text)),
+    )
+    parts = []
+    pos = 0
+    for start, neg_len, replace in matches:
+        if start < pos:
+            continue
+        parts.append(text[pos:start])
+        parts.append(replace)
+        pos = start - neg_len
+    if not parts:
+        return None
+    parts.append(text[pos:])
+    return "".join(parts)
+
+
+def _scan_and_replace_many(filepath, automaton):
+    """Applies a set of replacements to one file, returning True if it was changed."""
+    with open(filepath, "rb") as f:
+        # surrogateescape round-trips any bytes that are not valid UTF-8.
+        text = f.read().decode("utf-8", errors="surrogateescape")
+    replaced = _replace_many(text, automaton)
+    if replaced is None:
+        return False
+    _atomic_write(filepath, [replaced.encode("utf-8", errors="surrogateescape")])
+    return True
+
+
+def _report(filepaths, results):
+    """Prints the files that were changed, in walk order."""
+    for filepath, changed in zip(filepaths, results):
+        if changed:
+            print(f"Replacing in: {filepath}")
+
+
+def _walk(directory, match):
+    """Yields regular files under a directory whose names satisfy the matcher."""
+    # DirEntry carries the file type from the directory read itself, so no
+    # extra stat() is needed per entry.
+    subdirs = []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.is_file(follow_symlinks=False) and match(entry.name):
+                    yield entry.path
+    except OSError:
+        # Unreadable directories are skipped, as os.walk does.
+        return
+    for subdir in subdirs:
+        yield from _walk(subdir, match)
+
+
+def _collect(directory, pattern):
+    """Lists the files under a directory whose names match the pattern."""
+    # The pattern is compiled once rather than re-parsed for every file name.
+    return list(_walk(directory, re.compile(fnmatch.translate(pattern)).match))
+
+
+def _process(filepaths, scan):
+    """Runs a per-file scan over all paths and reports the changed ones."""
+    # Each file is independent, so the scan is spread across all cores. Small
+    # trees are not worth the cost of starting the worker processes.
+    if len(filepaths) <= CHUNK_SIZE:
+        _report(filepaths, map(scan, filepaths))
+    else:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            _report(filepaths, executor.map(scan, filepaths, chunksize=CHUNK_SIZE))
+
 
 def find_replace(directory, find, replace, pattern="*"):
-    from fnmatch import fnmatch
-    for path, _, files in os.walk(directory):
-        for name in files:
-            if fnmatch(name, pattern):
-                filepath = os.path.join(path, name)
-                with open(filepath) as f:
-                    s = f.read()
-                if find in s:
-                    print(f"Replacing in: {filepath}")
-                    s = s.replace(find, replace)
-                    with open(filepath, "w") as f:
-                        f.write(s)
+    scan = partial(_scan_and_replace, find_bytes=find.encode(), replace_bytes=replace.encode())
+    _process(_collect(directory, pattern), scan)
+
+
+def find_replace_many(directory, pairs, pattern="*"):
+    """Applies several find/replace pairs in a single pass over each file."""
+    scan = partial(_scan_and_replace_many, automaton=_build_automaton(pairs))
+    _process(_collect(directory, pattern), scan)
+
+
+def _load_pairs(path):
+    """Loads a JSON list of [find, replace] pairs."""
+    with open(path) as f:
+        pairs = json.load(f)
+    if not isinstance(pairs, list) or not pairs:
+        raise ValueError("expected a non-empty list of [find, replace] string pairs")
+    for pair in pairs:
+        if not (isinstance(pair, list) and len(pair) == 2
+                and all(isinstance(s, str) for s in pair) and pair[0]):
+            raise ValueError(f"invalid pair {pair!r}; expected [find, replace] strings")
+    return pairs
+
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Find and replace text in files.")
-    parser.add_argument("find", help="The text to find.")
-    parser.add_argument("replace", help="The text to replace with.")
+    parser.add_argument("find", help="The text to find.", nargs="?")
+    parser.add_argument("replace", help="The text to replace with.", nargs="?")
     parser.add_argument("directory", help="The directory to search in.", default=".", nargs="?")
     parser.add_argument("--pattern", help="File pattern to search for (e.g., '*.py').", default="*")
+    parser.add_argument("--map", help="JSON file with a list of [find, replace] pairs, "
+                                      "applied together in one pass.")
     args = parser.parse_args()
 
-    find_replace(args.directory, args.find, args.replace, args.pattern)
+    if args.map:
+        # With --map, the only positional argument is the directory.
+        if args.replace is not None:
+            parser.error("--map takes at most one positional argument: the directory")
+        try:
+            pairs = _load_pairs(args.map)
+        except (OSError, ValueError) as e:
+            parser.error(f"could not load --map file '{args.map}': {e}")
+        find_replace_many(args.find or ".", pairs, args.pattern)
+    else:
+        if args.find is None or args.replace is None:
+            parser.error("the following arguments are required: find, replace")
+        if not args.find:
+            parser.error("the text to find must not be empty")
+        find_replace(args.directory, args.find, args.replace, args.pattern)
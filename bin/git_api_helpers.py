@@ -5,7 +5,9 @@
 # NOTE: Secret management has been moved to the `git_tools.config` module
 # to centralise logic and enable lazy loading.
 # -----------------------------------------------------------------------------
-import re
+# GitHub remotes always start with one of these fixed prefixes, so they can be
+# dispatched on with plain string operations rather than a regex.
+_GH_URL_PREFIXES = ("git@github.com:", "https://github.com/")
 
 
 def get_repo_from_remote_url(remote_url):
@@ -13,14 +15,13 @@ def get_repo_from_remote_url(remote_url):
     Parses a GitHub repository owner and name from an SSH or HTTPS URL.
     Returns a tuple (owner, repo_name) or (None, None) on failure.
     """
-    # Regex for SSH: git@github.com:owner/repo.git
-    ssh_match = re.search(r'git@github\.com:([^/]+)/(.+?)(?:\.git)?$', remote_url)
-    if ssh_match:
-        return ssh_match.group(1), ssh_match.group(2)
-
-    # Regex for HTTPS: https://github.com/owner/repo.git
-    https_match = re.search(r'https://github\.com/([^/]+)/(.+?)(?:\.git)?$', remote_url)
-    if https_match:
-        return https_match.group(1), https_match.group(2)
-
-    return None, None
+    for prefix in _GH_URL_PREFIXES:
+        if remote_url.startswith(prefix):
+            rest = remote_url[len(prefix):]
+            break
+    else:
+        return (None, None)
+    if rest.endswith(".git"):
+        rest = rest[:-len(".git")]
+    owner, sep, repo = rest.partition("/")
+    return (owner, repo) if owner and sep and repo else (None, None)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Caches repository metadata that would otherwise be rediscovered on every git
+invocation.
+
+Every 'git' process re-does repository discovery (walking up to '.git',
+reading 'packed-refs', parsing config). For status-style probes this module
+answers the cheap questions directly from the filesystem instead:
+
+- The git directory of a working tree is resolved once per '.git' entry,
+  and resolved again whenever that entry is replaced.
+"""
+
+import functools
+import os
+from pathlib import Path
+from typing import Optional, Tuple
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_dot_git(dot_git: Path, signature: Tuple[int, int, int]) -> Optional[Path]:
+    """Resolves a '.git' entry; cached until the entry is replaced."""
+    if dot_git.is_dir():
+        return dot_git
+    try:
+        content = dot_git.read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    if content.startswith("gitdir:"):
+        git_dir = Path(content[len("gitdir:"):].strip())
+        return (dot_git.parent / git_dir).resolve()
+    return None
+
+
+def resolve_git_dir(path: Path) -> Optional[Path]:
+    """
+    Finds the git directory for a path by walking up to the nearest '.git'.
+
+    Handles both regular repositories ('.git' is a directory) and linked
+    worktrees or submodules ('.git' is a file containing 'gitdir: <path>').
+    The resolution is keyed on the '.git' entry's signature, so a repository
+    that is deleted and re-initialised is resolved afresh.
+
+    Args:
+        path: A path inside a working tree.
+
+    Returns:
+        The resolved git directory, or None if the path is not inside a
+        repository.
+    """
+    for candidate in (path, *path.parents):
+        dot_git = candidate / ".git"
+        signature = file_signature(dot_git)
+        if signature is not None:
+            return _resolve_dot_git(dot_git, signature)
+    return None
+
+
+def common_dir(git_dir: Path) -> Path:
+    """Returns the directory holding shared refs (differs for worktrees)."""
+    try:
+        common = (git_dir / "commondir").read_text(encoding="utf-8").strip()
+    except OSError:
+        return git_dir
+    return (git_dir / common).resolve()
+
+
+def file_signature(path: Path) -> Optional[Tuple[int, int, int]]:
+    """
+    Returns a value that changes whenever a file is rewritten.
+
+    Git updates files like 'HEAD' and 'config' by renaming a lock file over
+    them, so the inode changes on every write even when the mtime resolution
+    is coarse.
+
+    Args:
+        path: The file to inspect.
+
+    Returns:
+        An (inode, mtime_ns, size) tuple, or None if the file does not exist.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_ino, st.st_mtime_ns, st.st_size
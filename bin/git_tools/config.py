@@ -8,12 +8,25 @@ and personal access token from the 'pass' password manager.
 It is designed with a lazy-loading pattern. Secrets are only retrieved from the
 'pass' password manager when they are first requested. Subsequent requests
 during the same script execution will use a cached value.
+
+On first access, all known secrets are decrypted concurrently, so the
+GPG-agent handshake of each 'pass' invocation overlaps instead of being paid
+once per secret. When the optional 'python-gnupg' library is installed, the
+password-store files are decrypted with it directly, without going through
+the 'pass' shell script.
+
+The token can also come from the GITHUB_TOKEN environment variable, in
+which case the store is not consulted for it.
 """
 
 import functools
+import os
 import subprocess
 import sys
-from typing import Final
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Final, Iterable, Optional
 
 from .exceptions import ConfigurationError
 
@@ -65,6 +78,108 @@ def _get_secret_from_pass(pass_path: str) -> str:
         raise ConfigurationError(error_message) from e
 
 
+_GITHUB_USERNAME_PATH: Final = "git/github_username"
+_GITHUB_TOKEN_PATH: Final = "git/personal_access_token"
+
+_secret_cache: Dict[str, str] = {}
+_prefetch_lock = threading.Lock()
+_prefetched = False
+
+
+@functools.lru_cache(maxsize=None)
+def _get_gpg() -> Optional[Any]:
+    """Returns a shared 'gnupg.GPG' instance, or None if python-gnupg is missing."""
+    try:
+        import gnupg
+    except ImportError:
+        return None
+    return gnupg.GPG()
+
+
+def _decrypt_from_store(pass_path: str) -> Optional[str]:
+    """
+    Decrypts a secret straight from the password-store file with python-gnupg.
+
+    Args:
+        pass_path (str): The path to the secret within the password store.
+
+    Returns:
+        Optional[str]: The secret, or None if it could not be decrypted this
+            way (the caller then falls back to the 'pass' command).
+    """
+    gpg = _get_gpg()
+    if gpg is None:
+        return None
+
+    store_dir = os.environ.get("PASSWORD_STORE_DIR", "~/.password-store")
+    secret_file = Path(store_dir).expanduser() / f"{pass_path}.gpg"
+    try:
+        with open(secret_file, "rb") as f:
+            result = gpg.decrypt_file(f)
+    except OSError:
+        return None
+    if not result.ok:
+        return None
+    return result.data.decode("utf-8").strip() or None
+
+
+def _prefetch_secrets(pass_paths: Iterable[str]) -> None:
+    """
+    Retrieves several secrets at once, decrypting them in parallel.
+
+    Secrets are decrypted in-process when python-gnupg is available, and by
+    running 'pass' for each otherwise. Successfully retrieved secrets are
+    stored in the module's secret cache. Failures are ignored here; they
+    surface with a proper error when the secret is requested through
+    '_get_secret_from_pass'.
+
+    Args:
+        pass_paths: The paths to the secrets within the password store.
+    """
+    if _get_gpg() is not None:
+        pass_paths = list(pass_paths)
+        with ThreadPoolExecutor(max_workers=len(pass_paths) or 1) as executor:
+            secrets = executor.map(_decrypt_from_store, pass_paths)
+            for pass_path, secret in zip(pass_paths, secrets):
+                if secret:
+                    _secret_cache[pass_path] = secret
+        return
+
+    try:
+        processes = {
+            pass_path: subprocess.Popen(
+                ['pass', 'show', pass_path],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                encoding='utf-8'
+            )
+            for pass_path in pass_paths
+        }
+    except OSError:
+        return
+
+    for pass_path, process in processes.items():
+        stdout, _ = process.communicate()
+        secret = stdout.strip()
+        if process.returncode == 0 and secret:
+            _secret_cache[pass_path] = secret
+
+
+def _get_secret(pass_path: str) -> str:
+    """Returns a secret, prefetching all known secrets on the first call."""
+    global _prefetched
+    with _prefetch_lock:
+        if not _prefetched:
+            _prefetched = True
+            _prefetch_secrets((_GITHUB_USERNAME_PATH, _GITHUB_TOKEN_PATH))
+
+    secret = _secret_cache.get(pass_path)
+    if secret is None:
+        secret = _get_secret_from_pass(pass_path)
+    return secret
+
+
 @functools.lru_cache(maxsize=None)
 def get_github_username() -> str:
     """
@@ -73,15 +188,21 @@ def get_github_username() -> str:
     Raises:
         ConfigurationError: If the secret cannot be loaded at runtime.
     """
-    return _get_secret_from_pass("git/github_username")
+    return _get_secret(_GITHUB_USERNAME_PATH)
 
 
 @functools.lru_cache(maxsize=None)
 def get_github_token() -> str:
     """
-    Lazily retrieves and caches the GitHub token from the pass store.
+    Lazily retrieves and caches the GitHub token.
+
+    The GITHUB_TOKEN environment variable takes precedence over the pass
+    store. The token is only cached in memory, for the life of the process.
 
     Raises:
         ConfigurationError: If the secret cannot be loaded at runtime.
     """
-    return _get_secret_from_pass("git/personal_access_token")
+    token = os.environ.get("GITHUB_TOKEN", "").strip()
+    if token:
+        return token
+    return _get_secret(_GITHUB_TOKEN_PATH)
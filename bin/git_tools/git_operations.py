@@ -7,18 +7,73 @@ high-level operations like initializing a repository, creating commits, and
 managing remotes.
 """
 
+import configparser
+import functools
+import itertools
 import logging
+import os
 import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Literal, Optional, Tuple, Union, overload
 
+from . import cache
 from .exceptions import GitRepositoryError
 from .models import RepoStatus
 
+# Optional: sets up new repositories in-process through libgit2, instead of
+# spawning a git process for each step.
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None  # type: ignore[assignment]
 
+
+# Python creates every descriptor non-inheritable (PEP 446), so on Linux the
+# child has nothing to close and the per-spawn close loop can be skipped.
+_CLOSE_FDS = sys.platform != "linux"
+
+
+def _decode_output(output: Optional[Union[str, bytes]]) -> str:
+    """Returns captured output as stripped text, decoding bytes if needed."""
+    if output is None:
+        return ""
+    if isinstance(output, bytes):
+        output = output.decode('utf-8', errors='replace')
+    return output.strip()
+
+
+@overload
 def run_git_command(
-    args: List[str], cwd: Optional[Path] = None
-) -> subprocess.CompletedProcess[str]:
+    args: List[str],
+    cwd: Optional[Path] = ...,
+    text: Literal[True] = ...,
+    read_only: bool = ...,
+    ok_returncodes: Tuple[int, ...] = ...,
+) -> subprocess.CompletedProcess[str]: ...
+
+
+@overload
+def run_git_command(
+    args: List[str],
+    cwd: Optional[Path] = ...,
+    *,
+    text: Literal[False],
+    read_only: bool = ...,
+    ok_returncodes: Tuple[int, ...] = ...,
+) -> subprocess.CompletedProcess[bytes]: ...
+
+
+def run_git_command(
+    args: List[str],
+    cwd: Optional[Path] = None,
+    text: bool = True,
+    read_only: bool = False,
+    ok_returncodes: Tuple[int, ...] = (0,),
+) -> Union[subprocess.CompletedProcess[str], subprocess.CompletedProcess[bytes]]:
     """Runs a git command securely and captures its output.
 
     This function is a wrapper around subprocess.run that provides standardized
@@ -31,24 +86,39 @@ def run_git_command(
             its arguments (e.g., ['clone', 'some_url']).
         cwd (Optional[Path]): The working directory from which to run the
             command. Defaults to the current working directory.
+        text (bool): Whether to decode captured output as UTF-8. Callers that
+            only need the exit code can pass False to skip decoding; the
+            output is then returned as bytes.
+        read_only (bool): Whether to run git with '--no-optional-locks', so
+            that probes like 'status' do not take the index lock to write
+            back refreshed stat data, and never contend with other git
+            processes working in the same repository.
+        ok_returncodes (Tuple[int, ...]): The exit codes that count as
+            success. Commands that answer through their exit code, like
+            'diff --quiet', can accept 1 as well.
 
     Returns:
-        subprocess.CompletedProcess[str]: A CompletedProcess instance on success.
+        subprocess.CompletedProcess: A CompletedProcess instance on success.
 
     Raises:
         GitRepositoryError: If the 'git' command is not found or if the command
                             returns a non-zero exit code.
     """
-    command = ['git'] + args
+    command = ['git', '--no-optional-locks'] + args if read_only else ['git'] + args
     logging.debug(f"Running command: {' '.join(command)}")
     try:
+        if not text:
+            return subprocess.run(
+                command, cwd=cwd, capture_output=True, check=True, close_fds=_CLOSE_FDS
+            )
         result = subprocess.run(
             command,
             cwd=cwd,
             capture_output=True,
             text=True,
             check=True,
-            encoding='utf-8'
+            encoding='utf-8',
+            close_fds=_CLOSE_FDS
         )
         return result
     except FileNotFoundError as e:
@@ -56,21 +126,85 @@ def run_git_command(
             "The 'git' command was not found. Is Git installed and in your PATH?"
         ) from e
     except subprocess.CalledProcessError as e:
+        if e.returncode in ok_returncodes:
+            return subprocess.CompletedProcess(e.cmd, e.returncode, e.stdout, e.stderr)
         # Provide rich context upon command failure.
         error_message = (
             f"Git command failed: {' '.join(command)}\n"
             f"Return code: {e.returncode}\n"
-            f"Stderr: {e.stderr.strip()}\n"
-            f"Stdout: {e.stdout.strip()}"
+            f"Stderr: {_decode_output(e.stderr)}\n"
+            f"Stdout: {_decode_output(e.stdout)}"
         )
         raise GitRepositoryError(error_message) from e
 
 
+def run_git_command_streaming(
+    args: List[str],
+    cwd: Optional[Path] = None,
+    read_only: bool = False,
+    chunk_size: int = 65536,
+) -> Iterator[bytes]:
+    """Runs a git command and yields its raw stdout as it is produced.
+
+    Unlike run_git_command, the output is never held in memory as a whole,
+    and the caller can process it while git is still running.
+
+    Args:
+        args (List[str]): The git command and its arguments.
+        cwd (Optional[Path]): The working directory from which to run the
+            command. Defaults to the current working directory.
+        read_only (bool): Whether to run git with '--no-optional-locks' (see
+            run_git_command).
+        chunk_size (int): The maximum number of bytes yielded at once.
+
+    Yields:
+        bytes: Successive pieces of the command's standard output.
+
+    Raises:
+        GitRepositoryError: If the 'git' command is not found or if the command
+                            returns a non-zero exit code.
+    """
+    command = ['git', '--no-optional-locks'] + args if read_only else ['git'] + args
+    logging.debug(f"Streaming command: {' '.join(command)}")
+    # Stderr goes to a file so that a chatty command cannot fill the pipe and
+    # stall while only stdout is being read.
+    with tempfile.TemporaryFile() as stderr:
+        try:
+            proc = subprocess.Popen(
+                command, cwd=cwd, stdout=subprocess.PIPE, stderr=stderr,
+                close_fds=_CLOSE_FDS
+            )
+        except FileNotFoundError as e:
+            raise GitRepositoryError(
+                "The 'git' command was not found. Is Git installed and in your PATH?"
+            ) from e
+        with proc:
+            assert proc.stdout is not None
+            # A raw read returns whatever the pipe holds, up to chunk_size,
+            # without waiting for the buffer to fill.
+            fd = proc.stdout.fileno()
+            while chunk := os.read(fd, chunk_size):
+                yield chunk
+        if proc.returncode:
+            stderr.seek(0)
+            raise GitRepositoryError(
+                f"Git command failed: {' '.join(command)}\n"
+                f"Return code: {proc.returncode}\n"
+                f"Stderr: {_decode_output(stderr.read())}"
+            )
+
+
 def is_git_repository(path: Path) -> bool:
     """Checks if the given path is the root of a Git repository."""
+    # Without a '.git' entry anywhere up the tree (and no GIT_DIR override),
+    # git would only confirm that this is not a repository.
+    if "GIT_DIR" not in os.environ and not any(
+        (candidate / ".git").exists() for candidate in (path, *path.parents)
+    ):
+        return False
     try:
         # This command succeeds only if ran inside a Git repository.
-        run_git_command(["rev-parse", "--is-inside-work-tree"], cwd=path)
+        run_git_command(["rev-parse", "--is-inside-work-tree"], cwd=path, text=False)
         return True
     except GitRepositoryError:
         return False
@@ -78,12 +212,51 @@ def is_git_repository(path: Path) -> bool:
 
 def get_current_branch(path: Path) -> str:
     """Gets the current active branch name."""
+    # HEAD is a one-line text file, so it is read directly instead of asking
+    # a 'git rev-parse --abbrev-ref HEAD' process.
+    git_dir = cache.resolve_git_dir(path)
+    if git_dir is not None:
+        try:
+            head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+        except OSError:
+            head = None
+        if head is not None:
+            # Like 'rev-parse --abbrev-ref', a detached HEAD is named 'HEAD'.
+            return head.removeprefix("ref: refs/heads/") if head.startswith("ref: ") else "HEAD"
     result = run_git_command(["rev-parse", "--abbrev-ref", "HEAD"], cwd=path)
     return result.stdout.strip()
 
 
-def get_remote_url(path: Path) -> Optional[str]:
-    """Gets the URL for the remote named 'origin', if it exists."""
+def _read_origin_url(config_path: Path) -> Tuple[bool, Optional[str]]:
+    """
+    Reads 'remote.origin.url' straight from a repository's config file.
+
+    Returns:
+        A (found, url) tuple. 'found' is False when the file could not be
+        interpreted here (it is malformed or pulls in other files through
+        'include'), and git itself has to be asked instead.
+    """
+    parser = configparser.ConfigParser(
+        strict=False, interpolation=None, inline_comment_prefixes=("#", ";")
+    )
+    try:
+        parser.read(config_path, encoding="utf-8")
+    except (configparser.Error, UnicodeDecodeError):
+        return False, None
+    if any(section.lower().startswith("include") for section in parser.sections()):
+        return False, None
+    url = parser.get('remote "origin"', "url", fallback=None)
+    return True, url.strip('"') if url else None
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_remote_url(path: Path, config_signature: Tuple[int, int, int]) -> Optional[str]:
+    """Looks up the remote URL; cached until the config file is rewritten."""
+    git_dir = cache.resolve_git_dir(path)
+    if git_dir is not None:
+        found, url = _read_origin_url(cache.common_dir(git_dir) / "config")
+        if found:
+            return url
     try:
         result = run_git_command(["config", "--get", "remote.origin.url"], cwd=path)
         return result.stdout.strip()
@@ -92,9 +265,135 @@ def get_remote_url(path: Path) -> Optional[str]:
         return None
 
 
+def get_remote_url(path: Path) -> Optional[str]:
+    """Gets the URL for the remote named 'origin', if it exists."""
+    # Adding or changing a remote rewrites the repository config file.
+    git_dir = cache.resolve_git_dir(path)
+    signature = (
+        cache.file_signature(cache.common_dir(git_dir) / "config") if git_dir else None
+    )
+    if signature is None:
+        return _cached_remote_url.__wrapped__(path, None)
+    return _cached_remote_url(path, signature)
+
+
+def initialize_local_repo(path: Path, repo_name: str) -> None:
+    """
+    Creates a directory holding a Git repository and a README, as needed.
+
+    Existing directories, repositories and READMEs are left untouched, so the
+    function can be re-run on a partially set up repository.
+
+    Args:
+        path: The path of the repository's working tree.
+        repo_name: The repository name, used as the README's title.
+
+    Raises:
+        GitRepositoryError: If the directory or repository cannot be created.
+    """
+    try:
+        path.mkdir(parents=True, exist_ok=True)
+        # One directory read answers both existence checks below.
+        with os.scandir(path) as it:
+            entries = {entry.name for entry in it}
+    except OSError as e:
+        raise GitRepositoryError(f"Failed to create directory '{path}': {e}") from e
+
+    if ".git" not in entries:
+        if pygit2 is not None:
+            try:
+                pygit2.init_repository(str(path), initial_head="main")
+            except pygit2.GitError as e:
+                raise GitRepositoryError(f"Failed to initialize '{path}': {e}") from e
+        else:
+            run_git_command(["init", "--initial-branch=main"], cwd=path)
+        print(f"Initialized Git repository in {path}")
+
+    if "README.md" not in entries:
+        (path / "README.md").write_text(f"# {repo_name}\n", encoding="utf-8")
+        print("Created README.md")
+
+
+def _commit_all_in_process(path: Path, message: str) -> bool:
+    """Stages everything and commits it through libgit2 (see create_initial_commit)."""
+    try:
+        repo = pygit2.Repository(str(path))
+        repo.index.add_all()
+        repo.index.write()
+        tree_id = repo.index.write_tree()
+
+        if repo.head_is_unborn:
+            if not len(repo.index):
+                return False
+            parents = []
+        else:
+            head = repo.head.peel(pygit2.Commit)
+            if head.tree_id == tree_id:
+                return False
+            parents = [head.id]
+
+        signature = repo.default_signature
+        repo.create_commit("HEAD", signature, signature, message, tree_id, parents)
+        return True
+    except (pygit2.GitError, KeyError) as e:
+        # libgit2 reports a missing user.name/user.email as a KeyError.
+        raise GitRepositoryError(f"Failed to commit in '{path}': {e}") from e
+
+
+def create_initial_commit(path: Path, message: str = "Initial commit") -> bool:
+    """
+    Stages all files in a repository and commits them, if anything changed.
+
+    Args:
+        path: The path to the Git repository.
+        message: The commit message.
+
+    Returns:
+        True if a commit was created, False if there was nothing to commit.
+
+    Raises:
+        GitRepositoryError: If staging or committing fails.
+    """
+    if pygit2 is not None:
+        committed = _commit_all_in_process(path, message)
+    else:
+        run_git_command(["add", "."], cwd=path)
+        # Exits with 1 when anything is staged, without formatting any output.
+        result = run_git_command(
+            ["diff", "--cached", "--quiet"], cwd=path, text=False, ok_returncodes=(0, 1)
+        )
+        committed = result.returncode == 1
+        if committed:
+            run_git_command(["commit", "-m", message], cwd=path)
+
+    print("Created initial commit." if committed else "No changes to commit.")
+    return committed
+
+
+def rename_local_repo(old_path: Path, new_path: Path) -> None:
+    """
+    Renames a local repository directory.
+
+    Args:
+        old_path: The current path of the repository.
+        new_path: The new path for the repository.
+
+    Raises:
+        GitRepositoryError: If the target exists or the rename fails.
+    """
+    if os.path.lexists(new_path):
+        raise GitRepositoryError(f"Cannot rename: '{new_path}' already exists.")
+    try:
+        os.rename(old_path, new_path)
+    except OSError as e:
+        raise GitRepositoryError(f"Failed to rename '{old_path}' to '{new_path}': {e}") from e
+    print(f"Renamed local directory '{old_path}' to '{new_path}'")
+
+
 def set_remote_origin(path: Path, username: str, repo_name: str) -> None:
     """
-    Sets the 'origin' remote for a local Git repository.
+    Sets the 'origin' remote for a local Git repository, replacing its URL if
+    the remote already exists.
 
     Args:
         path: The path to the Git repository.
@@ -105,7 +404,19 @@ def set_remote_origin(path: Path, username: str, repo_name: str) -> None:
         GitRepositoryError: If the Git command fails.
     """
     remote_url = f"git@github.com:{username}/{repo_name}.git"
-    run_git_command(["remote", "add", "origin", remote_url], cwd=path)
+    if pygit2 is not None:
+        try:
+            remotes = pygit2.Repository(str(path)).remotes
+            if "origin" in remotes.names():
+                remotes.set_url("origin", remote_url)
+            else:
+                remotes.create("origin", remote_url)
+        except pygit2.GitError as e:
+            raise GitRepositoryError(f"Failed to set remote 'origin': {e}") from e
+    else:
+        # A renamed repository already has an 'origin' to repoint.
+        verb = "set-url" if get_remote_url(Path(path)) else "add"
+        run_git_command(["remote", verb, "origin", remote_url], cwd=path)
     print(f"Set remote 'origin' to {remote_url}")
 
 
@@ -124,77 +435,152 @@ def push_to_origin(path: Path, branch_name: str) -> None:
     print(f"Pushed branch '{branch_name}' to origin.")
 
 
-def _get_ahead_behind(cwd: Path) -> Optional[Tuple[int, int]]:
-    """Returns (ahead, behind) counts relative to the upstream branch."""
-    try:
-        # This command gets the tracking branch name (e.g., 'origin/main')
-        upstream = run_git_command(["rev-parse", "--abbrev-ref", "--symbolic-full-name", "@{u}"],
-                                   cwd=cwd).stdout.strip()
-        if not upstream:
-            return None
-
-        # Get the ahead/behind counts
-        output = run_git_command(["rev-list", "--left-right", "--count", f"{upstream}...HEAD"],
-                                 cwd=cwd).stdout.strip()
-        behind, ahead = map(int, output.split())
-        return ahead, behind
-    except GitRepositoryError as e:
-        # This typically happens if the upstream branch is not configured
-        if "no upstream configured" in e.args[0] or "unknown revision" in e.args[0]:
-            return None
-        raise
-
-
-def _get_messy_status(cwd: Path) -> Tuple[bool, int, int]:
-    """Returns (is_messy, modified_count, untracked_count)."""
-    output = run_git_command(["status", "--porcelain"], cwd=cwd).stdout
-    lines = output.strip().splitlines()
-
-    if not lines:
-        return False, 0, 0
-
-    modified_count = 0
-    untracked_count = 0
-    for line in lines:
-        if line.startswith("??"):
-            untracked_count += 1
-        else:
-            modified_count += 1
+def _parse_porcelain_v2(chunks: Iterable[bytes], status: RepoStatus) -> None:
+    """
+    Fills a RepoStatus from 'git status --porcelain=v2 --branch' output.
+
+    The '# branch.*' header lines carry the branch, its upstream and the
+    ahead/behind counts; every other line is one changed ('1', '2', 'u') or
+    untracked ('?') path.
 
-    return True, modified_count, untracked_count
+    Args:
+        chunks: The command's raw standard output, in arbitrarily sized
+            pieces. Only the header values are decoded; the entries are
+            counted as bytes.
+        status: The status object to update in place.
+    """
+    upstream = None
+    in_headers = True
+    modified = untracked = 0
+    pending = b""
+
+    # Each block handed to the loop body holds whole lines only; a partial
+    # line at the end of a chunk waits for the rest in 'pending'.
+    for chunk in itertools.chain(chunks, [b"\n"]):
+        data = pending + chunk
+        cut = data.rfind(b"\n") + 1
+        block, pending = data[:cut], data[cut:]
+
+        # The headers always come first; walk just those lines.
+        pos = 0
+        while in_headers and block.startswith(b"# ", pos):
+            end = block.find(b"\n", pos)
+            line = block[pos:end].decode("utf-8", errors="replace")
+            pos = end + 1
+            if line.startswith("# branch.head "):
+                head = line[len("# branch.head "):]
+                # Match 'git rev-parse --abbrev-ref HEAD' for a detached HEAD.
+                status.current_branch = "HEAD" if head == "(detached)" else head
+            elif line.startswith("# branch.upstream "):
+                upstream = line[len("# branch.upstream "):]
+            elif line.startswith("# branch.ab "):
+                # Only present when the upstream branch actually exists.
+                ahead, behind = line[len("# branch.ab "):].split()
+                status.ahead_count = int(ahead)
+                status.behind_count = -int(behind)
+                status.upstream_branch = upstream
+        if pos < len(block):
+            in_headers = False
+
+        # The entries are only counted, so each kind is tallied with one
+        # C-level scan rather than a Python loop over the lines. Paths with
+        # special characters are quoted by git, so every entry starts after
+        # a newline.
+        entries = b"\n" + block[pos:]
+        modified += sum(entries.count(tag) for tag in (b"\n1 ", b"\n2 ", b"\nu "))
+        untracked += entries.count(b"\n? ")
+
+    status.modified_files = modified
+    status.untracked_files = untracked
+    status.is_messy = bool(modified or untracked)
+
+
+# Minimum number of seconds between two fetches of the same repository.
+fetch_min_interval: float = 30.0
+_last_fetch: Dict[Path, float] = {}
+
+
+def _fetch_if_stale(repo_path: Path, git_dir: Path) -> bool:
+    """
+    Fetches from the remote unless it was fetched within fetch_min_interval.
+
+    Returns:
+        True if a fetch was run, False if the last one was recent enough.
+    """
+    last = _last_fetch.get(git_dir)
+    if last is not None and time.monotonic() - last < fetch_min_interval:
+        return False
+    # Fetch latest changes from the remote without merging
+    run_git_command(["fetch"], cwd=repo_path)
+    _last_fetch[git_dir] = time.monotonic()
+    return True
 
 
-def get_repo_status(repo_path: Path) -> RepoStatus:
+def get_repo_status(repo_path: Path, do_fetch: bool = True) -> RepoStatus:
     """
     Fetches the complete status of a Git repository by comparing its local state
     with its remote.
 
     Args:
         repo_path: The path to the Git repository.
+        do_fetch: Whether to fetch from the remote first. Repeated calls fetch
+            at most once per 'fetch_min_interval' seconds; pass False to only
+            compare against the remote-tracking refs already present.
 
     Returns:
         A RepoStatus object containing the detailed status.
     """
-    if not is_git_repository(repo_path):
+    # Discover the git directory once from the filesystem, instead of asking
+    # a 'git rev-parse' process whether this is a repository.
+    git_dir = cache.resolve_git_dir(repo_path)
+    if git_dir is None:
         return RepoStatus(is_repo=False)
 
     status = RepoStatus(is_repo=True)
 
-    # Fetch latest changes from the remote without merging
-    print("Fetching from remote...")
-    run_git_command(["fetch"], cwd=repo_path)
-
-    status.current_branch = get_current_branch(repo_path)
+    if do_fetch:
+        status.fetched = _fetch_if_stale(repo_path, git_dir)
+
+    # A single status call reports the branch, upstream, ahead/behind counts
+    # and working tree state, which would otherwise take one git process each.
+    # Its output can be large and is mostly counted, so it is parsed as it
+    # streams in, without being decoded or buffered whole.
+    output = run_git_command_streaming(
+        ["status", "--porcelain=v2", "--branch", "--untracked-files=normal"],
+        cwd=repo_path,
+        read_only=True,
+    )
+    _parse_porcelain_v2(output, status)
     status.remote_url = get_remote_url(repo_path)
 
-    ahead_behind = _get_ahead_behind(repo_path)
-    if ahead_behind:
-        status.ahead_count, status.behind_count = ahead_behind
-        status.upstream_branch = run_git_command(
-            ["rev-parse", "--abbrev-ref", "--symbolic-full-name", "@{u}"],
-            cwd=repo_path
-        ).stdout.strip()
+    return status
 
-    status.is_messy, status.modified_files, status.untracked_files = _get_messy_status(repo_path)
 
-    return status
+def get_repo_statuses(
+    paths: List[Path], max_workers: int = 16, do_fetch: bool = True
+) -> Dict[Path, RepoStatus]:
+    """
+    Fetches the status of several repositories concurrently.
+
+    Each status check mostly waits on git subprocesses and the network fetch,
+    during which the GIL is released, so a thread pool overlaps them.
+
+    Args:
+        paths: The paths to the Git repositories.
+        max_workers: The maximum number of repositories checked at once.
+        do_fetch: Whether to fetch from each remote first (see get_repo_status).
+
+    Returns:
+        A dict mapping each path to its RepoStatus, in the order given. A
+        repository whose check failed gets a status with only 'error' set, so
+        one bad path does not hide the results for the others.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(get_repo_status, path, do_fetch) for path in paths]
+        statuses: Dict[Path, RepoStatus] = {}
+        for path, future in zip(paths, futures):
+            try:
+                statuses[path] = future.result()
+            except GitRepositoryError as e:
+                statuses[path] = RepoStatus(is_repo=True, error=str(e))
+        return statuses
@@ -1,15 +1,65 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
-Handles interactions with the GitHub REST API.
+Handles interactions with the GitHub REST and GraphQL APIs.
 """
 
+import functools
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 from . import config
 from .exceptions import GitHubAPIError, ConfigurationError
 
+# GitHub rejects API requests without a User-Agent and asks that it identify
+# the client.
+USER_AGENT = "dotfiles-git-tools"
+
+
+@functools.lru_cache(maxsize=None)
+def _get_session() -> requests.Session:
+    """
+    Lazily creates the session shared by all API calls.
+
+    Reusing one session keeps the connection to api.github.com alive, so only
+    the first request pays for the TCP and TLS handshakes. Transient gateway
+    errors are retried for idempotent methods only.
+    """
+    session = requests.Session()
+    session.headers["Accept"] = "application/vnd.github.v3+json"
+    session.headers["User-Agent"] = USER_AGENT
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+    session.mount(
+        "https://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retries)
+    )
+    return session
+
+
+@functools.lru_cache(maxsize=None)
+def _get_headers(token: str) -> Mapping[str, str]:
+    """Builds the read-only request headers once per token."""
+    return MappingProxyType({
+        "Authorization": f"token {token}",
+        "Accept": "application/vnd.github.v3+json",
+    })
+
+
+def _parse_json(response: requests.Response) -> Any:
+    """Decodes a JSON response body, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
 
 def _make_api_request(method: str, url: str, **kwargs) -> requests.Response:
     """
@@ -28,12 +78,11 @@ def _make_api_request(method: str, url: str, **kwargs) -> requests.Response:
     """
     try:
         # Lazily retrieve the token just before the request is made.
-        token = config.get_github_token()
-        headers = {
-            "Authorization": f"token {token}",
-            "Accept": "application/vnd.github.v3+json",
-        }
-        response = requests.request(
+        headers = _get_headers(config.get_github_token())
+        if "headers" in kwargs:
+            headers = {**headers, **kwargs.pop("headers")}
+
+        response = _get_session().request(
             method, url, headers=headers, timeout=15, **kwargs
         )
         response.raise_for_status()
@@ -48,18 +97,49 @@ def _make_api_request(method: str, url: str, **kwargs) -> requests.Response:
         raise GitHubAPIError(f"Failed to connect to GitHub API: {e}") from e
 
 
+def _is_http_status(error: GitHubAPIError, status_code: int) -> bool:
+    """Checks whether an API error was caused by a response with the given status."""
+    cause = error.__cause__
+    return isinstance(cause, requests.HTTPError) and cause.response.status_code == status_code
+
+
 def create_github_repo(repo_name: str) -> None:
-    """Creates a new public repository on GitHub."""
+    """
+    Creates a new public repository on GitHub, unless it already exists.
+
+    The repository is looked up first, so re-running a script on an existing
+    repository costs a cheap GET rather than a rejected POST.
+    """
+    try:
+        owner = config.get_github_username()
+    except ConfigurationError as e:
+        raise GitHubAPIError(f"Configuration failed: {e}") from e
+
+    # GitHub redirects the old name of a renamed repository to its new one,
+    # so redirects are not followed: a 301 means the name itself is free.
+    try:
+        response = _make_api_request(
+            "get", f"https://api.github.com/repos/{owner}/{repo_name}",
+            allow_redirects=False,
+        )
+    except GitHubAPIError as e:
+        if not _is_http_status(e, 404):
+            raise
+    else:
+        if response.status_code == 200:
+            print(f"GitHub repository '{repo_name}' already exists. Proceeding...")
+            return
+
     api_url = "https://api.github.com/user/repos"
     data = {"name": repo_name, "private": False}
     try:
         _make_api_request("post", api_url, json=data)
         print(f"Successfully created GitHub repository '{repo_name}'")
     except GitHubAPIError as e:
-        if e.__cause__ and isinstance(e.__cause__, requests.HTTPError):
-            if e.__cause__.response.status_code == 422:
-                print(f"GitHub repository '{repo_name}' already exists. Proceeding...")
-                return
+        # The repository can still appear between the lookup and the POST.
+        if _is_http_status(e, 422):
+            print(f"GitHub repository '{repo_name}' already exists. Proceeding...")
+            return
         raise  # Re-raise if it's not the "already exists" error
 
 
@@ -138,9 +218,92 @@ def get_all_user_repos() -> list[dict]:
     # to get all the repositories if the user has more than 30.
     while api_url:
         response = _make_api_request("get", api_url, params={"per_page": 100})
-        repos.extend(response.json())
+        repos.extend(_parse_json(response))
 
         # Check for the 'next' link in the response headers
         api_url = response.links.get("next", {}).get("url")
 
     return repos
+
+
+GRAPHQL_URL = "https://api.github.com/graphql"
+
+_USER_REPOS_QUERY = """
+query($cursor: String) {
+  viewer {
+    repositories(
+      first: 100
+      after: $cursor
+      ownerAffiliations: [OWNER, COLLABORATOR, ORGANIZATION_MEMBER]
+      orderBy: {field: PUSHED_AT, direction: DESC}
+    ) {
+      pageInfo { endCursor hasNextPage }
+      nodes {
+        name
+        nameWithOwner
+        description
+        primaryLanguage { name }
+        languages(first: 3, orderBy: {field: SIZE, direction: DESC}) {
+          totalSize
+          edges { size node { name } }
+        }
+        createdAt
+        pushedAt
+        url
+      }
+    }
+  }
+}
+"""
+
+
+def graphql(query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Runs a query against the GitHub GraphQL API.
+
+    Args:
+        query: The GraphQL query document.
+        variables: Values for the query's variables, if any.
+
+    Returns:
+        The 'data' member of the response.
+
+    Raises:
+        GitHubAPIError: If the request fails or the response reports errors.
+    """
+    response = _make_api_request(
+        "post", GRAPHQL_URL, json={"query": query, "variables": variables or {}}
+    )
+    payload = _parse_json(response)
+    # GraphQL reports query errors with a 200 status, in the response body.
+    if payload.get("errors"):
+        messages = "; ".join(error.get("message", "") for error in payload["errors"])
+        raise GitHubAPIError(f"GitHub GraphQL query failed: {messages}")
+    data: Dict[str, Any] = payload["data"]
+    return data
+
+
+def get_all_user_repos_gql() -> list[dict]:
+    """
+    Fetches all repositories for the authenticated user through GraphQL.
+
+    Only the fields shown by the repository inspector are requested, 100
+    repositories per round trip, most recently pushed first. Each node
+    carries its three largest languages, so inspecting a repository needs no
+    further requests.
+
+    Returns:
+        A list of repository nodes, using GraphQL field names.
+
+    Raises:
+        GitHubAPIError: If the API call fails.
+    """
+    repos: list[dict] = []
+    cursor = None
+    while True:
+        data = graphql(_USER_REPOS_QUERY, {"cursor": cursor})
+        connection = data["viewer"]["repositories"]
+        repos.extend(connection["nodes"])
+        if not connection["pageInfo"]["hasNextPage"]:
+            return repos
+        cursor = connection["pageInfo"]["endCursor"]
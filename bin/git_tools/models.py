@@ -7,7 +7,7 @@ Defines data structures and models for the git_tools library.
 from dataclasses import dataclass
 from typing import Optional
 
-@dataclass
+@dataclass(slots=True)
 class RepoStatus:
     """A structured representation of a Git repository's status."""
     is_repo: bool
@@ -19,3 +19,5 @@ class RepoStatus:
     is_messy: bool = False
     untracked_files: int = 0
     modified_files: int = 0
+    fetched: bool = False
+    error: Optional[str] = None
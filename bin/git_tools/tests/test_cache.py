@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Unit tests for the cache module using temporary directories."""
+
+from git_tools import cache
+
+
+def test_resolve_git_dir_walks_up(tmp_path):
+    """Tests that the git directory is found from a nested path."""
+    (tmp_path / ".git").mkdir()
+    nested = tmp_path / "a" / "b"
+    nested.mkdir(parents=True)
+    assert cache.resolve_git_dir(nested) == tmp_path / ".git"
+
+
+def test_resolve_git_dir_follows_gitdir_file(tmp_path):
+    """Tests that a '.git' file (worktree/submodule) is followed."""
+    real_git_dir = tmp_path / "real.git"
+    real_git_dir.mkdir()
+    worktree = tmp_path / "worktree"
+    worktree.mkdir()
+    (worktree / ".git").write_text("gitdir: ../real.git\n")
+    assert cache.resolve_git_dir(worktree) == real_git_dir.resolve()
+
+
+def test_resolve_git_dir_not_a_repo(tmp_path):
+    """Tests that a path outside any repository resolves to None."""
+    assert cache.resolve_git_dir(tmp_path) is None
+
+
+def test_resolve_git_dir_sees_replaced_dot_git(tmp_path):
+    """Tests that a '.git' directory replaced by a gitdir file is resolved again."""
+    (tmp_path / ".git").mkdir()
+    assert cache.resolve_git_dir(tmp_path) == tmp_path / ".git"
+
+    (tmp_path / ".git").rmdir()
+    real_git_dir = tmp_path / "real.git"
+    real_git_dir.mkdir()
+    (tmp_path / ".git").write_text("gitdir: real.git\n")
+    assert cache.resolve_git_dir(tmp_path) == real_git_dir.resolve()
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Unit tests for the config module's token lookup using mocks."""
+
+import pytest
+
+from git_tools import config
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    """Clears the in-process token cache around each test."""
+    config.get_github_token.cache_clear()
+    yield
+    config.get_github_token.cache_clear()
+
+
+def test_token_from_environment(mocker, monkeypatch):
+    """Tests that GITHUB_TOKEN is used without touching the pass store."""
+    monkeypatch.setenv("GITHUB_TOKEN", "env-token")
+    get_secret = mocker.patch("git_tools.config._get_secret")
+    assert config.get_github_token() == "env-token"
+    get_secret.assert_not_called()
+
+
+def test_token_from_pass_store(mocker, monkeypatch):
+    """Tests that the token is read from the store once per process."""
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    get_secret = mocker.patch("git_tools.config._get_secret", return_value="pass-token")
+    assert config.get_github_token() == "pass-token"
+    assert config.get_github_token() == "pass-token"
+    get_secret.assert_called_once_with(config._GITHUB_TOKEN_PATH)
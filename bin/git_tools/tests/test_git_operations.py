@@ -2,18 +2,22 @@
 # -*- coding: utf-8 -*-
 """Unit tests for the git_operations module using mocks."""
 
+import shutil
 import subprocess
 from pathlib import Path
 import pytest
 
 from git_tools import git_operations
 from git_tools.exceptions import GitRepositoryError
+from git_tools.models import RepoStatus
+
 
 @pytest.fixture
 def mock_subprocess(mocker):
     """Fixture to mock subprocess.run."""
     return mocker.patch("subprocess.run")
 
+
 def test_run_git_command_success(mock_subprocess):
     """Tests a successful git command execution."""
     mock_subprocess.return_value = subprocess.CompletedProcess(
@@ -21,10 +25,12 @@ def test_run_git_command_success(mock_subprocess):
     )
     result = git_operations.run_git_command(["status"])
     mock_subprocess.assert_called_with(
-        ["git", "status"], cwd=None, capture_output=True, text=True, check=True, encoding='utf-8'
+        ["git", "status"], cwd=None, capture_output=True, text=True, check=True, encoding='utf-8',
+        close_fds=git_operations._CLOSE_FDS
     )
     assert result.stdout == "clean"
 
+
 def test_run_git_command_failure(mock_subprocess):
     """Tests a failed git command execution."""
     mock_subprocess.side_effect = subprocess.CalledProcessError(
@@ -37,8 +43,202 @@ def test_run_git_command_failure(mock_subprocess):
     assert "Repo not found" in str(excinfo.value)
     assert "Return code: 128" in str(excinfo.value)
 
+
+def test_run_git_command_ok_returncodes(mock_subprocess):
+    """Tests that an accepted non-zero exit code is returned instead of raised."""
+    mock_subprocess.side_effect = subprocess.CalledProcessError(
+        returncode=1, cmd=["git", "diff", "--quiet"], output=b"", stderr=b""
+    )
+    result = git_operations.run_git_command(["diff", "--quiet"], text=False, ok_returncodes=(0, 1))
+    assert result.returncode == 1
+    with pytest.raises(GitRepositoryError, match="Return code: 1"):
+        git_operations.run_git_command(["diff", "--quiet"], text=False)
+
+
+def test_run_git_command_bytes_failure(mock_subprocess):
+    """Tests that undecoded output is still decoded for the error message."""
+    mock_subprocess.side_effect = subprocess.CalledProcessError(
+        returncode=128, cmd=["git", "rev-parse"], stderr=b"not a git repository"
+    )
+    with pytest.raises(GitRepositoryError, match="not a git repository"):
+        git_operations.run_git_command(["rev-parse"], text=False)
+    mock_subprocess.assert_called_with(
+        ["git", "rev-parse"], cwd=None, capture_output=True, check=True,
+        close_fds=git_operations._CLOSE_FDS
+    )
+
+
+def test_run_git_command_read_only(mock_subprocess):
+    """Tests that read-only commands skip git's optional locks."""
+    git_operations.run_git_command(["status"], read_only=True)
+    assert mock_subprocess.call_args[0][0] == ["git", "--no-optional-locks", "status"]
+
+
 def test_run_git_command_not_found(mock_subprocess):
     """Tests when the git command itself is not found."""
     mock_subprocess.side_effect = FileNotFoundError
     with pytest.raises(GitRepositoryError, match="command was not found"):
         git_operations.run_git_command(["status"])
+
+
+def test_parse_porcelain_v2():
+    """Tests that branch headers and file entries are parsed from one status call."""
+    output = (
+        b"# branch.oid 1234567890abcdef\n"
+        b"# branch.head main\n"
+        b"# branch.upstream origin/main\n"
+        b"# branch.ab +2 -1\n"
+        b"1 .M N... 100644 100644 100644 abc abc file.py\n"
+        b"2 R. N... 100644 100644 100644 abc abc R100 new.py\told.py\n"
+        b"? notes.txt\n"
+    )
+    # Chunk boundaries may fall anywhere, even inside a header line.
+    for chunks in ([output], [output[i:i + 1] for i in range(len(output))]):
+        status = RepoStatus(is_repo=True)
+        git_operations._parse_porcelain_v2(chunks, status)
+        assert status.current_branch == "main"
+        assert status.upstream_branch == "origin/main"
+        assert (status.ahead_count, status.behind_count) == (2, 1)
+        assert (status.modified_files, status.untracked_files) == (2, 1)
+        assert status.is_messy
+
+
+def test_parse_porcelain_v2_without_upstream():
+    """Tests an unborn branch with no upstream and a clean tree."""
+    output = b"# branch.oid (initial)\n# branch.head main\n"
+    status = RepoStatus(is_repo=True)
+    git_operations._parse_porcelain_v2([output], status)
+    assert status.current_branch == "main"
+    assert status.upstream_branch is None
+    assert not status.is_messy
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+def test_run_git_command_streaming(tmp_path):
+    """Tests streaming a real command's output and surfacing its failure."""
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    output = b"".join(git_operations.run_git_command_streaming(
+        ["status", "--porcelain=v2", "--branch"], cwd=tmp_path, chunk_size=4
+    ))
+    assert b"# branch.oid (initial)\n" in output
+    with pytest.raises(GitRepositoryError, match="Return code"):
+        list(git_operations.run_git_command_streaming(["rev-parse", "HEAD"], cwd=tmp_path))
+
+
+def test_get_repo_statuses(mocker):
+    """Tests that every path is checked and mapped to its own status."""
+    mocker.patch(
+        "git_tools.git_operations.get_repo_status",
+        side_effect=lambda path, do_fetch: RepoStatus(is_repo=True, current_branch=path.name),
+    )
+    paths = [Path("/repos/a"), Path("/repos/b")]
+    statuses = git_operations.get_repo_statuses(paths, max_workers=2)
+    assert list(statuses) == paths
+    assert [s.current_branch for s in statuses.values()] == ["a", "b"]
+
+
+def test_get_repo_statuses_keeps_other_results_on_failure(mocker):
+    """Tests that a failing repository is reported without dropping the rest."""
+    def fake_status(path, do_fetch):
+        if path.name == "a":
+            raise GitRepositoryError("fetch failed")
+        return RepoStatus(is_repo=True, current_branch=path.name)
+
+    mocker.patch("git_tools.git_operations.get_repo_status", side_effect=fake_status)
+    paths = [Path("/repos/a"), Path("/repos/b")]
+    statuses = git_operations.get_repo_statuses(paths, max_workers=2)
+    assert statuses[paths[0]].error == "fetch failed"
+    assert statuses[paths[1]].current_branch == "b"
+
+
+def test_get_repo_status_rate_limits_fetch(mocker, tmp_path):
+    """Tests that a repository is fetched at most once per interval."""
+    (tmp_path / ".git").mkdir()
+    run = mocker.patch("git_tools.git_operations.run_git_command")
+    mocker.patch(
+        "git_tools.git_operations.run_git_command_streaming",
+        return_value=[b"# branch.head main\n"],
+    )
+    mocker.patch("git_tools.git_operations.get_remote_url", return_value=None)
+    mocker.patch.dict(git_operations._last_fetch, clear=True)
+
+    assert git_operations.get_repo_status(tmp_path).fetched is True
+    assert git_operations.get_repo_status(tmp_path).fetched is False
+    git_operations.get_repo_status(tmp_path, do_fetch=False)
+    fetches = [c for c in run.call_args_list if c.args[0] == ["fetch"]]
+    assert len(fetches) == 1
+
+
+def test_is_git_repository_skips_git_outside_repos(mock_subprocess, tmp_path, monkeypatch):
+    """Tests that no git process is spawned when there is no '.git' up the tree."""
+    monkeypatch.delenv("GIT_DIR", raising=False)
+    assert git_operations.is_git_repository(tmp_path) is False
+    mock_subprocess.assert_not_called()
+
+
+def test_get_current_branch_reads_head(mock_subprocess, tmp_path):
+    """Tests that the branch comes from the HEAD file, without a git process."""
+    git_dir = tmp_path / ".git"
+    git_dir.mkdir()
+    head = git_dir / "HEAD"
+    head.write_text("ref: refs/heads/main\n")
+    assert git_operations.get_current_branch(tmp_path) == "main"
+
+    head.write_text("1234567890abcdef1234567890abcdef12345678\n")
+    assert git_operations.get_current_branch(tmp_path) == "HEAD"
+    mock_subprocess.assert_not_called()
+
+
+def test_get_remote_url_reads_config(mock_subprocess, tmp_path):
+    """Tests that the origin URL comes from the config file, without a git process."""
+    git_dir = tmp_path / ".git"
+    git_dir.mkdir()
+    (git_dir / "config").write_text(
+        '[core]\n\tbare = false\n'
+        '[remote "origin"]\n'
+        '\turl = git@github.com:user/repo.git\n'
+        '\tfetch = +refs/heads/*:refs/remotes/origin/*\n'
+    )
+    assert git_operations.get_remote_url(tmp_path) == "git@github.com:user/repo.git"
+
+    (git_dir / "config").write_text('[core]\n\tbare = false\n')
+    assert git_operations._read_origin_url(git_dir / "config") == (True, None)
+    mock_subprocess.assert_not_called()
+
+
+def test_rename_local_repo(tmp_path):
+    """Tests that a directory is renamed and an existing target is refused."""
+    old, new = tmp_path / "old", tmp_path / "new"
+    old.mkdir()
+    git_operations.rename_local_repo(old, new)
+    assert new.is_dir() and not old.exists()
+
+    old.mkdir()
+    with pytest.raises(GitRepositoryError):
+        git_operations.rename_local_repo(old, new)
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+@pytest.mark.parametrize("use_pygit2", [True, False])
+def test_create_local_repo_and_remote(mocker, tmp_path, use_pygit2):
+    """Tests setting up, committing and repointing a repo with and without pygit2."""
+    if use_pygit2 and git_operations.pygit2 is None:
+        pytest.skip("pygit2 is not installed")
+    if not use_pygit2:
+        mocker.patch("git_tools.git_operations.pygit2", None)
+
+    repo = tmp_path / "demo"
+    git_operations.initialize_local_repo(repo, "demo")
+    for key, value in (("user.name", "Test"), ("user.email", "test@example.com")):
+        subprocess.run(["git", "config", key, value], cwd=repo, check=True)
+    assert (repo / "README.md").read_text() == "# demo\n"
+    assert git_operations.create_initial_commit(repo) is True
+    assert git_operations.create_initial_commit(repo) is False
+
+    git_operations.set_remote_origin(repo, "user", "demo")
+    git_operations.set_remote_origin(repo, "user", "renamed")
+    url = subprocess.run(
+        ["git", "config", "--get", "remote.origin.url"],
+        cwd=repo, capture_output=True, text=True, check=True,
+    ).stdout.strip()
+    assert url == "git@github.com:user/renamed.git"
@@ -12,8 +12,10 @@ from git_tools.exceptions import GitHubAPIError, ConfigurationError
 
 @pytest.fixture
 def mock_requests(mocker):
-    """Fixture to mock requests.request."""
-    return mocker.patch("requests.request")
+    """Fixture to mock the shared session's request method."""
+    # Mocked responses are configured through .json(), not raw bytes.
+    mocker.patch("git_tools.github_api.orjson", None)
+    return mocker.patch("requests.Session.request")
 
 
 @pytest.fixture
@@ -23,24 +25,57 @@ def mock_config(mocker):
     mocker.patch("git_tools.config.get_github_username", return_value="fake-user")
 
 
-def test_create_github_repo_success(mock_requests):
+def _not_found():
+    """Builds a mocked 404 response for the existence check."""
+    response = MagicMock()
+    response.status_code = 404
+    response.raise_for_status.side_effect = requests.HTTPError(response=response)
+    return response
+
+
+def test_create_github_repo_success(mock_requests, mock_config):
     """Tests successful repository creation."""
     mock_response = MagicMock()
     mock_response.status_code = 201
-    mock_requests.return_value = mock_response
+    mock_requests.side_effect = [_not_found(), mock_response]
 
     github_api.create_github_repo("new-repo")
-    
-    # Check that 'post' was called on the correct URL
-    mock_requests.assert_called_once()
+
+    # The repository is looked up first, then created with a 'post'
+    assert mock_requests.call_count == 2
+    assert mock_requests.call_args_list[0][0] == (
+        "get", "https://api.github.com/repos/fake-user/new-repo"
+    )
     assert mock_requests.call_args[0][0] == "post"
     assert "user/repos" in mock_requests.call_args[0][1]
     # Check that the correct token was passed in headers
     assert "token fake-token" in mock_requests.call_args[1]['headers']['Authorization']
 
 
+def test_create_github_repo_skips_post_when_found(mock_requests, mock_config):
+    """Tests that no 'post' is sent for a repository that already exists."""
+    mock_requests.return_value = MagicMock(status_code=200, headers={})
+
+    github_api.create_github_repo("existing-repo")
+
+    mock_requests.assert_called_once()
+    assert mock_requests.call_args[0][0] == "get"
+
+
+def test_create_github_repo_ignores_renamed_repo(mock_requests, mock_config):
+    """Tests that a redirect to a renamed repository does not count as existing."""
+    moved = MagicMock(status_code=301, headers={})
+    created = MagicMock(status_code=201)
+    mock_requests.side_effect = [moved, created]
+
+    github_api.create_github_repo("old-name")
+
+    assert mock_requests.call_args_list[0][1]["allow_redirects"] is False
+    assert mock_requests.call_args[0][0] == "post"
+
+
 def test_create_github_repo_already_exists(mock_requests, mock_config):
-    """Tests repository creation when it already exists (status 422)."""
+    """Tests repository creation when it appears after the lookup (status 422)."""
     mock_response = MagicMock()
     mock_response.status_code = 422
     mock_response.json.return_value = {
@@ -49,7 +84,7 @@ def test_create_github_repo_already_exists(mock_requests, mock_config):
     }
     # Configure raise_for_status to raise the appropriate error
     mock_response.raise_for_status.side_effect = requests.HTTPError(response=mock_response)
-    mock_requests.return_value = mock_response
+    mock_requests.side_effect = [_not_found(), mock_response]
 
     # This should not raise an exception, just log a message
     github_api.create_github_repo("existing-repo")
@@ -72,6 +107,7 @@ def test_api_call_raises_on_config_error(mocker):
     a GitHubAPIError if the config function fails.
     """
     # Mock the config function to raise an error
+    mocker.patch("git_tools.config.get_github_username", return_value="fake-user")
     mocker.patch(
         "git_tools.config.get_github_token",
         side_effect=ConfigurationError("Could not find pass")
@@ -80,3 +116,56 @@ def test_api_call_raises_on_config_error(mocker):
     # We expect this to be caught and re-raised as a GitHubAPIError
     with pytest.raises(GitHubAPIError, match="Configuration failed: Could not find pass"):
         github_api.create_github_repo("any-repo")
+
+
+def test_get_all_user_repos_gql_paginates(mock_requests, mock_config):
+    """Tests that GraphQL pages are followed until the last one."""
+    pages = [
+        {"data": {"viewer": {"repositories": {
+            "pageInfo": {"endCursor": "c1", "hasNextPage": True},
+            "nodes": [{"name": "a"}],
+        }}}},
+        {"data": {"viewer": {"repositories": {
+            "pageInfo": {"endCursor": "c2", "hasNextPage": False},
+            "nodes": [{"name": "b"}],
+        }}}},
+    ]
+    mock_requests.return_value.json.side_effect = pages
+
+    repos = github_api.get_all_user_repos_gql()
+
+    assert [repo["name"] for repo in repos] == ["a", "b"]
+    assert mock_requests.call_args[1]["json"]["variables"] == {"cursor": "c1"}
+
+
+def test_graphql_raises_on_errors(mock_requests, mock_config):
+    """Tests that errors reported in a 200 response are raised."""
+    mock_requests.return_value.json.return_value = {"errors": [{"message": "Bad query"}]}
+    with pytest.raises(GitHubAPIError, match="Bad query"):
+        github_api.graphql("query { viewer { login } }")
+
+
+def test_get_all_user_repos_follows_next_links(mock_requests, mock_config):
+    """Tests that 'next' links are followed serially."""
+    first, last = MagicMock(), MagicMock()
+    first.json.return_value = [{"name": "a"}]
+    first.links = {"next": {"url": "https://api.github.com/user/repos?page=2"}}
+    last.json.return_value = [{"name": "b"}]
+    last.links = {}
+    mock_requests.side_effect = [first, last]
+
+    repos = github_api.get_all_user_repos()
+
+    assert [repo["name"] for repo in repos] == ["a", "b"]
+    assert mock_requests.call_count == 2
+
+
+def test_parse_json_prefers_orjson(mocker):
+    """Tests that orjson decodes the raw body when it is available."""
+    fake_orjson = mocker.patch("git_tools.github_api.orjson")
+    fake_orjson.loads.return_value = {"ok": True}
+    response = MagicMock(content=b'{"ok": true}')
+    assert github_api._parse_json(response) == {"ok": True}
+    fake_orjson.loads.assert_called_once_with(b'{"ok": true}')
+    response.json.assert_not_called()
+
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Unit tests for the utils module using temporary directories."""
+
+import os
+
+import pytest
+
+from git_tools import utils
+
+
+def test_parallel_rmtree_removes_tree(tmp_path):
+    """Tests that nested files and directories are all removed."""
+    root = tmp_path / "repo"
+    objects = root / ".git" / "objects" / "ab"
+    objects.mkdir(parents=True)
+    for i in range(20):
+        (objects / f"{i:038d}").write_text("blob")
+    (root / "README.md").write_text("readme")
+    utils.parallel_rmtree(root)
+    assert not root.exists()
+
+
+def test_parallel_rmtree_does_not_follow_symlinks(tmp_path):
+    """Tests that symlinked directories are unlinked, not emptied."""
+    target = tmp_path / "target"
+    target.mkdir()
+    (target / "keep.txt").write_text("keep")
+    root = tmp_path / "repo"
+    root.mkdir()
+    os.symlink(target, root / "link")
+    utils.parallel_rmtree(root)
+    assert not root.exists()
+    assert (target / "keep.txt").exists()
+
+
+def test_parallel_rmtree_rejects_symlink_root(tmp_path):
+    """Tests that a symlink passed as the root is refused."""
+    target = tmp_path / "target"
+    target.mkdir()
+    link = tmp_path / "link"
+    os.symlink(target, link)
+    with pytest.raises(OSError):
+        utils.parallel_rmtree(link)
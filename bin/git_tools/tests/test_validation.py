@@ -13,6 +13,7 @@ from git_tools import validation
     ("https://github.com/user/repo.git", ("user", "repo")),
     ("https://github.com/user/repo", ("user", "repo")),
     ("https://github.com/user.name/repo.name.git", ("user.name", "repo.name")),
+    ("git@github.com:user/repo.git\n", ("user", "repo")),  # Regex fallback
 ])
 def test_get_repo_from_remote_url_valid(url, expected):
     """Tests that valid GitHub URLs are parsed correctly."""
@@ -28,6 +29,20 @@ def test_get_repo_from_remote_url_invalid(url):
     """Tests that invalid URLs return None."""
     assert validation.get_repo_from_remote_url(url) is None
 
+# --- Tests for parse_repo_argument ---
+
+@pytest.mark.parametrize("argument, expected", [
+    ("repo", (None, "repo")),
+    (" repo.git\n", (None, "repo")),
+    ("/repo/", (None, "repo")),
+    ("user/repo", ("user", "repo")),
+    ("git@github.com:user/repo.git", ("user", "repo")),
+    ("https://github.com/user/repo", ("user", "repo")),
+])
+def test_parse_repo_argument(argument, expected):
+    """Tests that names, owner/name pairs and pasted URLs are reduced to (owner, name)."""
+    assert validation.parse_repo_argument(argument) == expected
+
 # --- Tests for validate_repo_name ---
 
 @pytest.mark.parametrize("name", ["repo", "repo-name", "repo.name", "repo_name"])
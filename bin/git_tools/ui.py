@@ -4,15 +4,26 @@
 Handles the user interface and console output for the list_git_repos tool.
 """
 
+import functools
+import sys
 from typing import Any, Dict, List
 from datetime import datetime
 
+# Python 3.11+ parses the 'Z' suffix natively, so no rewritten copy of the
+# string is needed.
+_FROMISO_ACCEPTS_Z = sys.version_info >= (3, 11)
+_STRFTIME_FMT = "%Y-%m-%d %H:%M:%S"
+
+# Re-inspecting a repository shows the same dates again, so each string is
+# only parsed once.
+@functools.lru_cache(maxsize=1024)
 def _parse_date(date_string: str) -> str:
     """Converts GitHub's ISO 8601 date string to a readable format."""
     if not date_string:
         return "N/A"
-    dt_object = datetime.fromisoformat(date_string.replace("Z", "+00:00"))
-    return dt_object.strftime("%Y-%m-%d %H:%M:%S")
+    if not _FROMISO_ACCEPTS_Z:
+        date_string = date_string.replace("Z", "+00:00")
+    return datetime.fromisoformat(date_string).strftime(_STRFTIME_FMT)
 
 def _display_repo_list(repos: List[Dict[str, Any]]) -> None:
     """Prints a numbered list of repositories."""
@@ -20,15 +31,28 @@ def _display_repo_list(repos: List[Dict[str, Any]]) -> None:
     for i, repo in enumerate(repos):
         print(f"  {i + 1:2d}) {repo['name']}")
 
+def _format_languages(repo: Dict[str, Any]) -> str:
+    """Formats a repository's largest languages with their share of its code."""
+    languages = repo.get('languages') or {}
+    total = languages.get('totalSize') or 0
+    edges = languages.get('edges') or []
+    if not total or not edges:
+        return 'N/A'
+    return ", ".join(
+        f"{edge['node']['name']} ({edge['size'] / total:.1%})" for edge in edges
+    )
+
 def _display_repo_details(repo: Dict[str, Any]) -> None:
     """Prints a detailed summary of a single repository."""
     print("\n--- Details ---")
-    print(f"Name:        {repo.get('full_name')}")
+    language = repo.get('primaryLanguage') or {}
+    print(f"Name:        {repo.get('nameWithOwner')}")
     print(f"Description: {repo.get('description') or 'No description provided.'}")
-    print(f"Language:    {repo.get('language') or 'N/A'}")
-    print(f"Created:     {_parse_date(repo.get('created_at'))}")
-    print(f"Last Push:   {_parse_date(repo.get('pushed_at'))}")
-    print(f"URL:         {repo.get('html_url')}")
+    print(f"Language:    {language.get('name') or 'N/A'}")
+    print(f"Languages:   {_format_languages(repo)}")
+    print(f"Created:     {_parse_date(repo.get('createdAt'))}")
+    print(f"Last Push:   {_parse_date(repo.get('pushedAt'))}")
+    print(f"URL:         {repo.get('url')}")
 
 def run_repo_inspector_menu(repos: List[Dict[str, Any]]) -> None:
     """
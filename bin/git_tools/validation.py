@@ -5,8 +5,17 @@ Provides input validation and parsing functions.
 """
 
 import re
+import sys
 from typing import Optional, Tuple
 
+# Compiled once at import rather than looked up in re's cache on every call.
+# Matches both SSH (git@github.com:owner/repo.git) and HTTPS
+# (https://github.com/owner/repo.git) remotes in a single scan.
+_GH_URL_PREFIXES = ("git@github.com:", "https://github.com/")
+_GH_URL_RE = re.compile(r'(?:git@github\.com:|https://github\.com/)([^/]+)/(.+?)(?:\.git)?$')
+# Allowed characters: letters, digits, hyphen, underscore, period.
+_NAME_RE = re.compile(r'[a-zA-Z0-9_.-]+')
+
 
 def get_repo_from_remote_url(remote_url: str) -> Optional[Tuple[str, str]]:
     """
@@ -19,19 +28,47 @@ def get_repo_from_remote_url(remote_url: str) -> Optional[Tuple[str, str]]:
         A tuple containing (owner, repo_name) if parsing is successful,
         otherwise None.
     """
-    # Regex for SSH: git@github.com:owner/repo.git
-    ssh_match = re.search(r'git@github\.com:([^/]+)/(.+?)(?:\.git)?$', remote_url)
-    if ssh_match:
-        return ssh_match.group(1).strip(), ssh_match.group(2).strip()
-
-    # Regex for HTTPS: https://github.com/owner/repo.git
-    https_match = re.search(r'https://github\.com/([^/]+)/(.+?)(?:\.git)?$', remote_url)
-    if https_match:
-        return https_match.group(1).strip(), https_match.group(2).strip()
+    # Fast path: well-formed remotes start with a fixed prefix and split on
+    # the single '/' between owner and name, with no regex involved.
+    for prefix in _GH_URL_PREFIXES:
+        if remote_url.startswith(prefix):
+            owner, sep, name = remote_url[len(prefix):].removesuffix(".git").partition("/")
+            if (owner and name and "/" not in name
+                    and owner == owner.strip() and name == name.strip()):
+                return owner, name
+            break
 
+    # Anything unusual (nested paths, stray whitespace, embedded URLs) goes
+    # through the full pattern.
+    match = _GH_URL_RE.search(remote_url)
+    if match:
+        return match.group(1).strip(), match.group(2).strip()
     return None
 
 
+def parse_repo_argument(argument: str) -> Tuple[Optional[str], str]:
+    """
+    Reduces a repository given on the command line to its owner and name.
+
+    Accepts a bare name ('repo', 'repo.git'), 'owner/repo', or a pasted SSH
+    or HTTPS GitHub URL, so that malformed input is caught before any
+    network round trip instead of failing in git or the API.
+
+    Args:
+        argument: The repository as typed by the user.
+
+    Returns:
+        A tuple (owner, repo_name). The owner is None when the argument did
+        not name one.
+    """
+    argument = argument.strip()
+    parsed = get_repo_from_remote_url(argument)
+    if parsed:
+        return parsed
+    owner, sep, name = argument.strip("/").removesuffix(".git").partition("/")
+    return (owner, name) if sep else (None, owner)
+
+
 def validate_repo_name(repo_name: str) -> bool:
     """
     Validates a repository name against common GitHub naming rules.
@@ -45,10 +82,10 @@ def validate_repo_name(repo_name: str) -> bool:
     if not repo_name or len(repo_name) > 100:
         print("Error: Repo name must be between 1 and 100 characters.", file=sys.stderr)
         return False
-    # Allowed characters: letters, digits, hyphen, underscore, period.
-    if not re.match(r'^[a-zA-Z0-9_.-]+$', repo_name):
+    if not _NAME_RE.fullmatch(repo_name):
         print("Error: Repo name contains invalid characters.", file=sys.stderr)
         return False
     if repo_name in {".", ".."}:
+        print("Error: Repo name cannot be '.' or '..'.", file=sys.stderr)
         return False
     return True
@@ -6,13 +6,13 @@ import sys
 from pathlib import Path
 
 try:
-    from git_tools import github_api, config
+    from git_tools import github_api, config, validation
     from git_tools.exceptions import GitToolsError, ConfigurationError
 
 except ImportError:
     # This allows the script to be run directly for development/testing
     sys.path.insert(0, str(Path(__file__).resolve().parent))
-    from git_tools import github_api, config
+    from git_tools import github_api, config, validation
     from git_tools.exceptions import GitToolsError, ConfigurationError
 
 
@@ -22,11 +22,14 @@ def main() -> None:
         print(f"Usage: {sys.argv[0]} <repo-name>", file=sys.stderr)
         sys.exit(1)
 
-    repo_name = sys.argv[1]
+    owner, repo_name = validation.parse_repo_argument(sys.argv[1])
+    if not validation.validate_repo_name(repo_name):
+        sys.exit(1)
 
     try:
-        # Lazily get the username from the config module
-        owner = config.get_github_username()
+        # Lazily get the username from the config module, unless the
+        # argument named the owner
+        owner = owner or config.get_github_username()
 
         print(f"Setting visibility of '{owner}/{repo_name}' to PRIVATE...")
 
@@ -19,7 +19,7 @@ def main() -> None:
     """Fetches repos and launches the interactive UI."""
     setup_logging()
     try:
-        repos = github_api.get_all_user_repos()
+        repos = github_api.get_all_user_repos_gql()
         if not repos:
             print("No repositories found.")
             return
@@ -1,23 +1,51 @@
 #!/usr/bin/env python3
 import http.server
-import socketserver
+import os
+import queue
+import threading
 import webbrowser
 import socket
 
-def find_free_port():
-    """Finds an available port on the local machine."""
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        s.bind(('', 0))
-        return s.getsockname()[1]
+class PooledHTTPServer(http.server.ThreadingHTTPServer):
+    """
+    A threaded HTTP server whose requests run on a fixed pool of workers.
 
-def main():
-    PORT = find_free_port()
-    Handler = http.server.SimpleHTTPRequestHandler
+    A browser fetches a page's assets in parallel, so requests are served
+    concurrently; the pool reuses its threads and caps how many run at once.
+    SO_REUSEPORT is set where the platform has it.
+    """
 
     # Allow reusing addresses to prevent errors on quick restarts
-    socketserver.TCPServer.allow_reuse_address = True
+    allow_reuse_address = True
+
+    def server_bind(self):
+        if hasattr(socket, "SO_REUSEPORT"):
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+    def server_activate(self):
+        super().server_activate()
+        # Like ThreadingHTTPServer's per-request threads, the workers are
+        # daemons, so a client holding a connection open cannot keep the
+        # process alive after Ctrl+C.
+        self._requests = queue.SimpleQueue()
+        for _ in range(min(32, (os.cpu_count() or 1) * 4)):
+            threading.Thread(target=self._serve_requests, daemon=True).start()
+
+    def _serve_requests(self):
+        while True:
+            self.process_request_thread(*self._requests.get())
+
+    def process_request(self, request, client_address):
+        self._requests.put((request, client_address))
+
+def main():
+    Handler = http.server.SimpleHTTPRequestHandler
 
-    with socketserver.TCPServer(("", PORT), Handler) as httpd:
+    # Binding to port 0 lets the OS pick a free port for the server's own
+    # socket, so no other process can take it between choosing and binding.
+    with PooledHTTPServer(("", 0), Handler) as httpd:
+        PORT = httpd.server_address[1]
         host = "127.0.0.1"
         url = f"http://{host}:{PORT}"
 
@@ -6,15 +6,6 @@
 import sys
 from pathlib import Path
 
-try:
-    from git_tools import git_operations, github_api, validation, config
-    from git_tools.exceptions import GitToolsError, ConfigurationError
-
-except ImportError:
-    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-    from git_tools import git_operations, github_api, validation, config
-    from git_tools.exceptions import GitToolsError, ConfigurationError
-
 
 def main() -> None:
     """Orchestrates the transactional repository rename process."""
@@ -24,13 +15,25 @@ def main() -> None:
 
     old_name = sys.argv[1]
     new_name = sys.argv[2]
-    old_path = Path.cwd() / old_name
-    new_path = Path.cwd() / new_name
+    cwd = Path.cwd()
+    old_path = cwd / old_name
+    new_path = cwd / new_name
 
     if not old_path.is_dir():
         print(f"Error: Directory '{old_name}' not found.", file=sys.stderr)
         sys.exit(1)
 
+    # The library is only imported once the arguments are known to be valid,
+    # so usage errors return without loading it.
+    try:
+        from git_tools import git_operations, github_api, validation, config
+        from git_tools.exceptions import GitToolsError, ConfigurationError
+
+    except ImportError:
+        sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+        from git_tools import git_operations, github_api, validation, config
+        from git_tools.exceptions import GitToolsError, ConfigurationError
+
     # Step 1: Validate the new name before any operations
     if not validation.validate_repo_name(new_name):
         sys.exit(1)
@@ -59,8 +62,8 @@ def main() -> None:
             print(f"Attempting to roll back GitHub rename...")
 
             try:
-                owner_for_rollback = config.get_github_username()
-                github_api.rename_github_repo(owner_for_rollback, new_name, old_name)
+                # The owner was resolved before the remote rename succeeded.
+                github_api.rename_github_repo(owner, new_name, old_name)
                 print("Rollback successful. GitHub repo is back to its original name.")
 
             except (GitToolsError, ConfigurationError) as rollback_e:
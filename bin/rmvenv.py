@@ -3,7 +3,9 @@
 # Safely finds and removes a standard Python virtual environment.
 # Intended to be called by the 'rmvenv' shell function.
 # -----------------------------------------------------------------------------
+import os
 import shutil
+import subprocess
 import sys
 from pathlib import Path
 
@@ -17,41 +19,82 @@ class Colors:
     RED = "\033[91m"
     ENDC = "\033[0m"
 
+def _fast_rmtree(path: Path) -> None:
+    """Deletes a directory tree bottom-up without recursing in Python.
+
+    os.walk lists each directory once with os.scandir, whose entries already
+    carry their file type, so no extra stat() is issued per file.
+    """
+    for root, dirs, files in os.walk(path, topdown=False, onerror=_raise):
+        for name in files:
+            os.unlink(os.path.join(root, name))
+        for name in dirs:
+            entry = os.path.join(root, name)
+            # Symlinks to directories are listed as directories but must be
+            # unlinked, never followed.
+            if os.path.islink(entry):
+                os.unlink(entry)
+            else:
+                os.rmdir(entry)
+    os.rmdir(path)
+
+def _raise(error: OSError) -> None:
+    raise error
+
 def main() -> None:
     """Main script logic."""
-    print(f"Searching for virtual environment at './{VENV_DIR}'...")
+    assume_yes = "-y" in sys.argv[1:] or "--yes" in sys.argv[1:]
+
+    # Output on the success path is collected and written in one call.
+    searching = f"Searching for virtual environment at './{VENV_DIR}'...\n"
 
     if not VENV_DIR.exists() or not VENV_DIR.is_dir():
-        print(f"{Colors.YELLOW}No virtual environment found. Nothing to do.{Colors.ENDC}")
+        print(searching + f"{Colors.YELLOW}No virtual environment found. Nothing to do.{Colors.ENDC}")
         sys.exit(0)
 
     # Safety check: Confirm this looks like a venv by checking for the Python executable
     python_executable = VENV_DIR / "bin" / "python"
     if not python_executable.exists():
+        sys.stdout.write(searching)
+        sys.stdout.flush()
         print(f"{Colors.RED}Error: Directory './{VENV_DIR}' exists but does not appear to be a valid virtual environment.{Colors.ENDC}", file=sys.stderr)
         sys.exit(1)
 
-    # Confirmation prompt
-    try:
-        confirm = input(f"{Colors.YELLOW}Are you sure want to permanently delete the virtual environment './{VENV_DIR}'? [y/N]: {Colors.ENDC}")
-        if confirm.lower() != 'y':
-            print("Operation cancelled.")
-            sys.exit(0)
-    except (KeyboardInterrupt, EOFError):
-        print("\nOperation cancelled.")
-        sys.exit(1)
+    # Confirmation prompt, skipped by '-y'/'--yes' for scripted use
+    if not assume_yes:
+        # The search line must appear before the prompt.
+        sys.stdout.write(searching)
+        sys.stdout.flush()
+        searching = ""
+        try:
+            confirm = input(f"{Colors.YELLOW}Are you sure want to permanently delete the virtual environment './{VENV_DIR}'? [y/N]: {Colors.ENDC}")
+            if confirm.lower() != 'y':
+                print("Operation cancelled.")
+                sys.exit(0)
+        except (KeyboardInterrupt, EOFError):
+            print("\nOperation cancelled.")
+            sys.exit(1)
 
     # Delete the repository
-    print(f"Deleting './{VENV_DIR}'...", end="", flush=True)
     try:
-        shutil.rmtree(VENV_DIR)
-        print(f"{Colors.GREEN}done{Colors.ENDC}")
-    except OSError as e:
-        print(f"{Colors.RED}failed{Colors.ENDC}")
+        # 'rm -rf' walks the tree in C, which is much faster than shutil.rmtree
+        # on a venv's thousands of small files. '--' stops the path being read
+        # as an option.
+        rm = shutil.which("rm")
+        if rm is not None:
+            subprocess.run([rm, "-rf", "--", str(VENV_DIR)], check=True)
+        else:
+            _fast_rmtree(VENV_DIR)
+    except (OSError, subprocess.CalledProcessError) as e:
+        print(f"{searching}Deleting './{VENV_DIR}'...{Colors.RED}failed{Colors.ENDC}")
         print(f"\n{Colors.RED}Error: Could not remove directory.\n{e}{Colors.ENDC}", file=sys.stderr)
         sys.exit(1)
 
-    print(f"\n{Colors.GREEN}✅ Virtual environment removed successfully!{Colors.ENDC}")
+    sys.stdout.write(
+        f"{searching}Deleting './{VENV_DIR}'...{Colors.GREEN}done{Colors.ENDC}\n"
+        f"\n{Colors.GREEN}✅ Virtual environment removed successfully!{Colors.ENDC}\n"
+    )
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     main()
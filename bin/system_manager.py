@@ -12,31 +12,77 @@ Usage:
     system_manager.py generate-docs
 """
 
+import abc
 import argparse
+import asyncio
+import functools
+import importlib.util
+import itertools
+import os
 import subprocess
 import shutil
+import signal
 import sys
 import json
+import mmap
+import multiprocessing
 import re
-from dataclasses import dataclass, field
-from typing import List, Optional, Protocol, Dict, Any
-from concurrent.futures import ThreadPoolExecutor
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from importlib.metadata import PackageNotFoundError, version as metadata_version
+from typing import TYPE_CHECKING, Callable, Iterator, List, Optional, Protocol, Dict, Any, Tuple, TypeVar, cast
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+# 'rich' and 'requests' are imported by the commands that use them, so
+# 'generate-docs' starts without loading either; main() checks they exist.
+REQUIRED_MODULES = ("rich", "requests")
+
+if TYPE_CHECKING:
+    import aiohttp
+    import requests
 
-# Third-party imports (Assumed present in environment)
+# Optional: decodes registry responses and JSON listings faster.
 try:
-    import requests
-    from rich.console import Console
-    from rich.table import Table
-    from rich.progress import track
-    from rich import print as rprint
+    import orjson as _json
 except ImportError:
-    print("Error: 'rich' and 'requests' libraries are required.")
-    print("pip install rich requests")
-    sys.exit(1)
+    import json as _json  # type: ignore[no-redef]
+
+# Optional: compares versions numerically instead of as plain strings.
+try:
+    from packaging.version import InvalidVersion, Version
+except ImportError:
+    Version = None  # type: ignore[assignment,misc]
+
+# Optional: lets 'status' run every latest-version lookup concurrently.
+# Imported on first use, like 'rich' and 'requests'.
+@functools.lru_cache(maxsize=None)
+def _import_aiohttp():
+    try:
+        import aiohttp
+    except ImportError:
+        return None
+    return aiohttp
 
 
 # --- Configuration ---
 DOCS_PATH = "PROVISIONING.md"
+LATEST_CACHE_PATH = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "system_manager", "latest.json",
+)
+DEFAULT_CACHE_TTL = 3600  # Upstream releases land hours or days apart.
+
+# --- Patterns ---
+# "package-name v1.2.3:" in 'cargo install --list'
+_CARGO_VER_RE = re.compile(r"v([\d.]+)")
+# "name (1.2.3, 1.2.0)" or "name (default: 1.2.3)" in 'gem list'
+_GEM_VER_RE = re.compile(r"(\S+) \((?:default: )?([\d.]+)")
+# Debian revision, build metadata or pre-release suffix after the upstream version
+_VERSION_SUFFIX_RE = re.compile(r"[-+~]")
+# One field line of the dpkg status database
+_DPKG_FIELD_RE = re.compile(rb"^(Package|Status|Version): (.*)$", re.M)
 
 
 # --- Interfaces ---
@@ -52,70 +98,366 @@ class PackageManager(Protocol):
         ...
 
 
+# --- Installed Package Tables ---
+
+DPKG_STATUS_PATH = "/var/lib/dpkg/status"
+
+
+def _parse_dpkg_status(data: "bytes | mmap.mmap") -> Dict[str, str]:
+    """Maps each installed package in a dpkg status database to its version."""
+    installed: Dict[str, str] = {}
+    package = status = None
+    # Fields are scanned in file order; every stanza starts with 'Package:'.
+    for match in _DPKG_FIELD_RE.finditer(data):
+        field_name, value = match.groups()
+        if field_name == b"Package":
+            package, status = value.decode(), None
+        elif field_name == b"Status":
+            status = value
+        elif package and status and status.endswith(b" installed"):
+            installed.setdefault(package, value.decode())
+    return installed
+
+
+def _read_dpkg_status(path: str) -> Dict[str, str]:
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return _parse_dpkg_status(data)
+    except (OSError, ValueError):
+        # ValueError: mmap cannot map an empty file.
+        return {}
+
+
+# Below this size, starting a worker process costs more than the parse itself.
+PROCESS_PARSE_MIN_BYTES = 4 * 1024 * 1024
+
+# The pool that takes large parses off the GIL. main() owns it for the length
+# of a command; without it, every parse runs in this process.
+_parse_pool: Optional[ProcessPoolExecutor] = None
+
+
+@functools.lru_cache(maxsize=1)
+def _dpkg_status_cache() -> Dict[str, str]:
+    """
+    Reads installed apt package versions straight from dpkg's database, which
+    is what dpkg-query itself parses, without starting a process.
+
+    A large database is parsed in a worker process, so the scan does not hold
+    the GIL while other lookups run; only the path goes to the worker and only
+    the small name-to-version dict comes back.
+    """
+    try:
+        size = os.stat(DPKG_STATUS_PATH).st_size
+    except OSError:
+        return {}
+    if _parse_pool is not None and size >= PROCESS_PARSE_MIN_BYTES:
+        return _parse_pool.submit(_read_dpkg_status, DPKG_STATUS_PATH).result()
+    return _read_dpkg_status(DPKG_STATUS_PATH)
+
+# These managers can list everything they have installed in one call, so each
+# list is read once per run and every tool is looked up in it.
+
+def _spawn_stdout(args: List[str]) -> Tuple[int, int]:
+    """Spawns a command with stdout on a pipe; returns its pid and the read end."""
+    # Both ends are non-inheritable (PEP 446); DUP2 gives the child its own
+    # inheritable copy as fd 1.
+    read_fd, write_fd = os.pipe()
+    try:
+        pid = os.posix_spawnp(args[0], args, os.environ, file_actions=[
+            (os.POSIX_SPAWN_DUP2, write_fd, 1),
+            (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+        ])
+    except BaseException:
+        os.close(read_fd)
+        raise
+    finally:
+        os.close(write_fd)
+    return pid, read_fd
+
+
+def _fast_capture(args: List[str]) -> Tuple[int, bytes]:
+    """
+    Runs a command and returns its exit code and stdout; stderr is discarded.
+
+    The child is started with os.posix_spawnp and its stdout wired to a pipe
+    through spawn file actions, so no Python-level fork machinery runs in the
+    child, whatever the size of this process.
+
+    Raises:
+        FileNotFoundError: If the command does not exist.
+    """
+    if not hasattr(os, "posix_spawnp"):
+        res = subprocess.run(args, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        return res.returncode, res.stdout
+
+    pid, read_fd = _spawn_stdout(args)
+    with open(read_fd, "rb") as pipe:
+        output = pipe.read()
+    _, wait_status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(wait_status), output
+
+
+def _stream_lines(args: List[str]) -> Iterator[str]:
+    """
+    Yields a read-only command's stdout line by line as it is produced, or
+    nothing if the command is missing. Parsing starts before the command
+    finishes, and if the caller stops early the command is terminated.
+    The exit code is ignored; a failing listing prints nothing to stdout.
+    """
+    if not hasattr(os, "posix_spawnp"):
+        yield from _list_output(args).splitlines()
+        return
+
+    try:
+        pid, read_fd = _spawn_stdout(args)
+    except FileNotFoundError:
+        return
+    exhausted = False
+    try:
+        with open(read_fd, "r", errors="replace") as pipe:
+            for line in pipe:
+                yield line.rstrip("\n")
+        exhausted = True
+    finally:
+        if not exhausted:
+            # Stopped before EOF: the rest of the output is not needed.
+            os.kill(pid, signal.SIGTERM)
+        os.waitpid(pid, 0)
+
+
+def _list_output(args: List[str]) -> str:
+    """Returns a read-only command's stdout, or "" if it is missing or fails."""
+    try:
+        returncode, output = _fast_capture(args)
+    except FileNotFoundError:
+        return ""
+    return output.decode(errors="replace") if returncode == 0 else ""
+
+
+@functools.lru_cache(maxsize=1)
+def _cargo_installed() -> Dict[str, str]:
+    installed = {}
+    for line in _stream_lines(["cargo", "install", "--list"]):
+        # Line format: "package-name v1.2.3:", followed by indented binaries
+        if line[:1].strip():
+            name, _, rest = line.partition(" ")
+            match = _CARGO_VER_RE.search(rest)
+            if match:
+                installed[name] = match.group(1)
+    return installed
+
+
+@functools.lru_cache(maxsize=1)
+def _snap_installed() -> Dict[str, str]:
+    installed = {}
+    lines = _stream_lines(["snap", "list"])
+    next(lines, None)  # Skip the header
+    # Snap output is fixed width, but split() usually works
+    for line in lines:
+        parts = line.split()
+        if len(parts) >= 2:
+            installed[parts[0]] = parts[1]
+    return installed
+
+
+@functools.lru_cache(maxsize=1)
+def _npm_global_root() -> str:
+    """The global node_modules directory, where each package keeps its package.json."""
+    return _list_output(["npm", "root", "-g"]).strip()
+
+
+@functools.lru_cache(maxsize=1)
+def _luarocks_installed() -> Dict[str, str]:
+    installed: Dict[str, str] = {}
+    # --porcelain outputs: name \t version \t status \t path
+    for line in _stream_lines(["luarocks", "list", "--porcelain"]):
+        parts = line.split("\t")
+        if len(parts) >= 3 and parts[2] == "installed":
+            installed.setdefault(parts[0], parts[1])
+    return installed
+
+
+@functools.lru_cache(maxsize=1)
+def _gem_installed() -> Dict[str, str]:
+    installed = {}
+    for line in _stream_lines(["gem", "list"]):
+        # Output: name (version[, older versions]) or name (default: version)
+        match = _GEM_VER_RE.match(line)
+        if match:
+            installed[match.group(1)] = match.group(2)
+    return installed
+
+
+@functools.lru_cache(maxsize=1)
+def _composer_installed() -> Dict[str, str]:
+    output = _list_output(["composer", "global", "show", "--format=json"])
+    try:
+        packages = _json.loads(output).get("installed", []) if output else []
+    except ValueError:
+        return {}
+    return {pkg["name"]: pkg["version"] for pkg in packages}
+
+
+@functools.lru_cache(maxsize=1)
+def _dotnet_installed() -> Dict[str, str]:
+    installed = {}
+    # Output: a header, a dashed rule, then "package.id   1.0.0   commands"
+    rows = _stream_lines(["dotnet", "tool", "list", "-g"])
+    for line in itertools.dropwhile(lambda line: not line.startswith("---"), rows):
+        parts = line.split()
+        if len(parts) >= 2 and not line.startswith("---"):
+            installed[parts[0].lower()] = parts[1]
+    return installed
+
+
+@functools.lru_cache(maxsize=1)
+def _sdkman_installed() -> Dict[str, str]:
+    """
+    Maps each SDKMAN! candidate to its current version, read from the
+    ~/.sdkman/candidates/<candidate>/current symlinks rather than by sourcing
+    sdkman-init.sh in a shell.
+    """
+    installed: Dict[str, str] = {}
+    candidates_dir = os.path.join(os.path.expanduser("~"), ".sdkman", "candidates")
+    try:
+        entries = os.scandir(candidates_dir)
+    except OSError:
+        return installed
+    with entries:
+        for entry in entries:
+            link_path = os.path.join(entry.path, "current")
+            try:
+                installed[entry.name] = os.path.basename(os.readlink(link_path))
+            except OSError:
+                pass
+    return installed
+
+
 # --- Implementations ---
 
-class AptManager:
-    def get_installed_version(self, package_name: str, binary_name: str) -> Optional[str]:
-        # Check via dpkg first as it's more reliable for exact version
+@functools.lru_cache(maxsize=None)
+def _get_session() -> "requests.Session":
+    """
+    Lazily creates the session shared by all registry lookups, so repeated
+    requests to one host (e.g. several pip tools on pypi.org) reuse a
+    keep-alive connection instead of each paying for a TLS handshake.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    retries = Retry(total=2, backoff_factor=0.1)
+    session.mount(
+        "https://", HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retries)
+    )
+    return session
+
+
+class HttpVersionLookup(abc.ABC):
+    """
+    Base for managers whose latest version comes from a registry's HTTP API.
+
+    Subclasses supply the URL and parse the response body. The request is made
+    on a shared requests session, or on a shared aiohttp session when 'status' checks all
+    tools at once.
+    """
+    HEADERS: Dict[str, str] = {}
+
+    @abc.abstractmethod
+    def latest_url(self, package_name: str) -> str:
+        """The registry URL that describes the package's latest release."""
+
+    @abc.abstractmethod
+    def parse_latest(self, body: bytes, package_name: str) -> Optional[str]:
+        """Extracts the latest version from the registry's response body."""
+
+    def get_latest_version(self, package_name: str) -> Optional[str]:
         try:
-            res = subprocess.run(
-                ["dpkg-query", "-W", "-f=${Version}", package_name],
-                capture_output=True, text=True
-            )
-            if res.returncode == 0 and res.stdout.strip():
-                return res.stdout.strip()
-        except FileNotFoundError:
+            resp = _get_session().get(self.latest_url(package_name), headers=self.HEADERS, timeout=3)
+            if resp.status_code == 200:
+                return self.parse_latest(resp.content, package_name)
+        except Exception:
             pass
         return None
 
-    def get_latest_version(self, package_name: str) -> Optional[str]:
-        # Check what version the repo is offering (Candidate)
+    async def get_latest_version_async(self, session: "aiohttp.ClientSession",
+                                       package_name: str) -> Optional[str]:
         try:
-            res = subprocess.run(
-                ["apt-cache", "policy", package_name],
-                capture_output=True, text=True
-            )
-            if res.returncode == 0:
-                for line in res.stdout.splitlines():
-                    if "Candidate:" in line:
-                        return line.split("Candidate:")[-1].strip()
-        except FileNotFoundError:
+            async with session.get(self.latest_url(package_name), headers=self.HEADERS) as resp:
+                if resp.status == 200:
+                    return self.parse_latest(await resp.read(), package_name)
+        except Exception:
             pass
         return None
 
+
+@dataclass(frozen=True)
+class VersionInfo:
+    installed: Optional[str]
+    candidate: Optional[str]
+
+
+class AptManager:
+    # Filled by bulk_query, so per-tool lookups need no process of their own.
+    _bulk: Dict[str, VersionInfo] = {}
+
+    @classmethod
+    def bulk_query(cls, packages: List[str]) -> Dict[str, VersionInfo]:
+        """
+        Looks up the installed and candidate versions of many packages with
+        one read of the dpkg database and one apt-cache call, instead of two
+        processes per package.
+        """
+        installed = _dpkg_status_cache()
+        candidates: Dict[str, str] = {}
+        name = None
+        for line in _stream_lines(["apt-cache", "policy", *packages]):
+            # Each package's block starts with an unindented "name:" line.
+            if line[:1].strip() and line.endswith(":"):
+                name = line[:-1]
+            elif name and "Candidate:" in line:
+                candidate = line.split("Candidate:")[-1].strip()
+                if candidate != "(none)":
+                    candidates[name] = candidate
+
+        cls._bulk = {
+            name: VersionInfo(installed.get(name), candidates.get(name)) for name in packages
+        }
+        return cls._bulk
+
+    def get_installed_version(self, package_name: str, binary_name: str) -> Optional[str]:
+        return _dpkg_status_cache().get(package_name)
+
+    def get_latest_version(self, package_name: str) -> Optional[str]:
+        if package_name in self._bulk:
+            return self._bulk[package_name].candidate
+        # Check what version the repo is offering (Candidate)
+        for line in _stream_lines(["apt-cache", "policy", package_name]):
+            if "Candidate:" in line:
+                return line.split("Candidate:")[-1].strip()
+        return None
+
     def install(self, package_name: str) -> bool:
-        print(f" [apt] Installing {package_name}...")
-        res = subprocess.run(["sudo", "apt", "install", "-y", package_name])
+        return self.install_many([package_name])
+
+    def install_many(self, package_names: List[str]) -> bool:
+        print(f" [apt] Installing {', '.join(package_names)}...")
+        res = subprocess.run(["sudo", "apt", "install", "-y", *package_names])
         return res.returncode == 0
 
 
 class SnapManager:
     def get_installed_version(self, package_name: str, binary_name: str) -> Optional[str]:
-        try:
-            res = subprocess.run(["snap", "list", package_name], capture_output=True, text=True)
-            if res.returncode == 0:
-                lines = res.stdout.splitlines()
-                if len(lines) > 1:
-                    # Parse columns. Snap output is fixed width, but split() usually works
-                    parts = lines[1].split()
-                    if len(parts) >= 2:
-                        return parts[1]
-        except FileNotFoundError:
-            pass
-        return None
+        return _snap_installed().get(package_name)
 
     def get_latest_version(self, package_name: str) -> Optional[str]:
-        try:
-            res = subprocess.run(["snap", "info", package_name], capture_output=True, text=True)
-            if res.returncode == 0:
-                for line in res.stdout.splitlines():
-                    if "latest/stable:" in line:
-                        # Line looks like: "latest/stable:  1.2.3   2023-01-01 (123) 50MB -"
-                        parts = line.split()
-                        if len(parts) >= 2:
-                            return parts[1]
-        except FileNotFoundError:
-            pass
+        for line in _stream_lines(["snap", "info", package_name]):
+            if "latest/stable:" in line:
+                # Line looks like: "latest/stable:  1.2.3   2023-01-01 (123) 50MB -"
+                parts = line.split()
+                if len(parts) >= 2:
+                    return parts[1]
         return None
 
     def install(self, package_name: str) -> bool:
@@ -124,137 +466,89 @@ class SnapManager:
         return res.returncode == 0
 
 
-class PipManager:
+class PipManager(HttpVersionLookup):
     def get_installed_version(self, package_name: str, binary_name: str) -> Optional[str]:
+        # Reads the dist-info metadata of this interpreter's environment, the
+        # same one 'python -m pip show' would report on, without starting pip.
         try:
-            # Use importlib logic via CLI for safety
-            res = subprocess.run(
-                [sys.executable, "-m", "pip", "show", package_name],
-                capture_output=True, text=True
-            )
-            if res.returncode == 0:
-                for line in res.stdout.splitlines():
-                    if line.startswith("Version:"):
-                        return line.split(":", 1)[1].strip()
-        except FileNotFoundError:
-            pass
-        return None
+            return metadata_version(package_name)
+        except PackageNotFoundError:
+            return None
 
-    def get_latest_version(self, package_name: str) -> Optional[str]:
-        try:
-            url = f"https://pypi.org/pypi/{package_name}/json"
-            resp = requests.get(url, timeout=3)
-            if resp.status_code == 200:
-                return resp.json()["info"]["version"]
-        except Exception:
-            pass
-        return None
+    def latest_url(self, package_name: str) -> str:
+        return f"https://pypi.org/pypi/{package_name}/json"
+
+    def parse_latest(self, body: bytes, package_name: str) -> Optional[str]:
+        return _json.loads(body)["info"]["version"]
 
     def install(self, package_name: str) -> bool:
-        print(f" [pip] Installing {package_name}...")
-        res = subprocess.run([sys.executable, "-m", "pip", "install", package_name])
+        return self.install_many([package_name])
+
+    def install_many(self, package_names: List[str]) -> bool:
+        print(f" [pip] Installing {', '.join(package_names)}...")
+        res = subprocess.run([sys.executable, "-m", "pip", "install", *package_names])
         return res.returncode == 0
 
 
-class CargoManager:
+class CargoManager(HttpVersionLookup):
+    HEADERS = {"User-Agent": "dotfiles-manager (contact@example.com)"}
+
     def get_installed_version(self, package_name: str, binary_name: str) -> Optional[str]:
-        # Cargo install list is slow, better to check the binary version if possible
-        # Or parse `cargo install --list`
-        try:
-            res = subprocess.run(["cargo", "install", "--list"], capture_output=True, text=True)
-            if res.returncode == 0:
-                for line in res.stdout.splitlines():
-                    if line.startswith(package_name):
-                        # Line format: "package-name v1.2.3:"
-                        match = re.search(r"v([\d.]+)", line)
-                        if match:
-                                return match.group(1)
-        except FileNotFoundError:
-            pass
-        return None
+        return _cargo_installed().get(package_name)
 
-    def get_latest_version(self, package_name: str) -> Optional[str]:
-        try:
-            url = f"https://crates.io/api/v1/crates/{package_name}"
-            headers = {"User-Agent": "dotfiles-manager (contact@example.com)"}
-            resp = requests.get(url, headers=headers, timeout=3)
-            if resp.status_code == 200:
-                return resp.json()["crate"]["max_version"]
-        except Exception:
-            pass
-        return None
+    def latest_url(self, package_name: str) -> str:
+        return f"https://crates.io/api/v1/crates/{package_name}"
+
+    def parse_latest(self, body: bytes, package_name: str) -> Optional[str]:
+        return _json.loads(body)["crate"]["max_version"]
 
     def install(self, package_name: str) -> bool:
-        print(f" [cargo] Installing {package_name}...")
-        res = subprocess.run(["cargo", "install", package_name])
+        return self.install_many([package_name])
+
+    def install_many(self, package_names: List[str]) -> bool:
+        print(f" [cargo] Installing {', '.join(package_names)}...")
+        res = subprocess.run(["cargo", "install", *package_names])
         return res.returncode == 0
 
 
-class NpmManager:
+class NpmManager(HttpVersionLookup):
+    # Both lookups avoid starting Node: the installed version comes from the
+    # package's own package.json, the latest from the registry's HTTP API.
     def get_installed_version(self, package_name: str, binary_name: str) -> Optional[str]:
+        root = _npm_global_root()
+        if not root:
+            return None
         try:
-            # Check global install list in JSON format
-            res = subprocess.run(
-                ["npm", "list", "-g", "--depth=0", "--json", package_name],
-                capture_output=True, text=True
-            )
-            # npm returns non-zero if package is missing or tree is invalid
-            # but we parse JSON regardless
-            if res.stdout:
-                data = json.loads(res.stdout)
-                deps = data.get("dependencies", {})
-                if package_name in deps:
-                    return deps[package_name].get("version")
-        except (FileNotFoundError, json.JSONDecodeError):
-            pass
-        return None
+            with open(os.path.join(root, package_name, "package.json"), "rb") as f:
+                return _json.loads(f.read()).get("version")
+        except (OSError, ValueError):
+            return None
 
-    def get_latest_version(self, package_name: str) -> Optional[str]:
-        try:
-            res = subprocess.run(
-                ["npm", "view", package_name, "version"],
-                capture_output=True, text=True
-            )
-            if res.returncode == 0:
-                return res.stdout.strip()
-        except FileNotFoundError:
-            pass
-        return None
+    def latest_url(self, package_name: str) -> str:
+        return f"https://registry.npmjs.org/{package_name}/latest"
+
+    def parse_latest(self, body: bytes, package_name: str) -> Optional[str]:
+        return _json.loads(body).get("version")
 
     def install(self, package_name: str) -> bool:
-        print(f" [npm] Installing {package_name}...")
-        res = subprocess.run(["sudo", "npm", "install", "-g", package_name])
+        return self.install_many([package_name])
+
+    def install_many(self, package_names: List[str]) -> bool:
+        print(f" [npm] Installing {', '.join(package_names)}...")
+        res = subprocess.run(["sudo", "npm", "install", "-g", *package_names])
         return res.returncode == 0
 
 
 class LuaRocksManager:
     def get_installed_version(self, package_name: str, binary_name: str) -> Optional[str]:
-        try:
-            res = subprocess.run(["luarocks", "list", package_name], capture_output=True, text=True)
-            for line in res.stdout.splitlines():
-                # Output format usually: " 1.0.0-1 (installed) ..."
-                if "(installed)" in line:
-                    return line.strip().split()[0]
-        except FileNotFoundError:
-            pass
-        return None
+        return _luarocks_installed().get(package_name)
 
     def get_latest_version(self, package_name: str) -> Optional[str]:
-        try:
-            # --porcelain outputs: name \t version \t status \t path
-            res = subprocess.run(
-                ["luarocks", "search", "--porcelain", package_name],
-                capture_output=True, text=True
-            )
-            versions = []
-            for line in res.stdout.splitlines():
-                parts = line.split("\t")
-                if len(parts) >= 2 and parts[0] == package_name:
-                    versions.append(parts[1])
-            if versions:
-                return versions[0] # Usually the first hit is the relevant one in search
-        except FileNotFoundError:
-            pass
+        # --porcelain outputs: name \t version \t status \t path
+        for line in _stream_lines(["luarocks", "search", "--porcelain", package_name]):
+            parts = line.split("\t")
+            if len(parts) >= 2 and parts[0] == package_name:
+                return parts[1] # Usually the first hit is the relevant one in search
         return None
 
     def install(self, package_name: str) -> bool:
@@ -263,83 +557,43 @@ class LuaRocksManager:
         return res.returncode == 0
 
 
-class GemManager:
+class GemManager(HttpVersionLookup):
     def get_installed_version(self, package_name: str, binary_name: str) -> Optional[str]:
-        try:
-            res = subprocess.run(["gem", "list", "-e", package_name], capture_output=True, text=True)
-            # Output: name (version)
-            if res.returncode == 0 and package_name in res.stdout:
-                match = re.search(r"\(([\d.]+\)", res.stdout)
-                if match:
-                    return match.group(1)
-        except FileNotFoundError:
-            pass
-        return None
+        return _gem_installed().get(package_name)
 
-    def get_latest_version(self, package_name: str) -> Optional[str]:
-        try:
-            # Query RubyGems API
-            url = f"https://rubygems.org/api/v1/gems/{package_name}.json"
-            resp = requests.get(url, timeout=3)
-            if resp.status_code == 200:
-                return resp.json()["version"]
-        except Exception:
-            pass
-        return None
+    def latest_url(self, package_name: str) -> str:
+        # Query RubyGems API
+        return f"https://rubygems.org/api/v1/gems/{package_name}.json"
+
+    def parse_latest(self, body: bytes, package_name: str) -> Optional[str]:
+        return _json.loads(body)["version"]
 
     def install(self, package_name: str) -> bool:
-        print(f" [gem] Installing {package_name}...")
-        res = subprocess.run(["sudo", "gem", "install", package_name])
+        return self.install_many([package_name])
+
+    def install_many(self, package_names: List[str]) -> bool:
+        print(f" [gem] Installing {', '.join(package_names)}...")
+        res = subprocess.run(["sudo", "gem", "install", *package_names])
         return res.returncode == 0
 
 
-class ComposerManager:
+class ComposerManager(HttpVersionLookup):
     """PHP Package Manager (Global)"""
     def get_installed_version(self, package_name: str, binary_name: str) -> Optional[str]:
-        try:
-            # Composer global show outputs info about a specific package
-            # We capture stdout to find 'versions : * 1.2.3'
-            res = subprocess.run(
-                ["composer", "global", "show", package_name],
-                capture_output=True, text=True
-            )
-            if res.returncode == 0:
-                for line in res.stdout.splitlines():
-                    if line.strip().startswith("versions"):
-                        # Line format: "versions : * 2.5.5"
-                        parts = line.split(":")
-                        if len(parts) > 1:
-                            # Remove the asterisk if present
-                            return parts[1].replace("*", "").strip()
-        except FileNotFoundError:
-            pass
-        return None
-
-    def get_latest_version(self, package_name: str) -> Optional[str]:
-        try:
-            # Query Packagist API
-            url = f"https://packagist.org/packages/{package_name}.json"
-            resp = requests.get(url, timeout=3)
-            if resp.status_code == 200:
-                data = resp.json()
-                # Packagist returns all versions. We need the latest stable.
-                versions = data.get("package", {}).get("versions", {})
-
-                # Filter out dev-master, beta, etc.
-                stable_versions = [
-                    v for v in versions.keys()
-                    if "dev" not in v and "beta" not in v and "alpha" not in v
-                ]
-
-                if stable_versions:
-                    # Sort implies relying on version strings (basic sort),
-                    # but usually the first one in the structure is most relevant or we rely on 'dist'.
-                    # A naive max(stable_versions) works reasonably well for standard semantic versioning
-                    return list(versions.keys())[0] # The API usually lists latest first or we pick specifically
-                    # For better precision we'd use 'packaging.version.parse', but let's keep it simple:
-                    # The Packagist API JSON usually structures keys such that we can iterate.
-        except Exception:
-            pass
+        return _composer_installed().get(package_name)
+
+    def latest_url(self, package_name: str) -> str:
+        # Packagist's metadata API (p2) lists only tagged releases, newest
+        # first, and is far smaller than the full package document.
+        return f"https://repo.packagist.org/p2/{package_name}.json"
+
+    def parse_latest(self, body: bytes, package_name: str) -> Optional[str]:
+        releases = _json.loads(body).get("packages", {}).get(package_name, [])
+        # Skip pre-releases such as "2.0.0-RC1" or "v3.0.0-beta.2".
+        for release in releases:
+            version = release.get("version", "")
+            if version and "-" not in version:
+                return version
         return None
 
     def install(self, package_name: str) -> bool:
@@ -348,38 +602,22 @@ class ComposerManager:
         return res.returncode == 0
 
 
-class DotnetManager:
+class DotnetManager(HttpVersionLookup):
     """source: NuGet via .NET CLI Global Tools"""
     def get_installed_version(self, package_name: str, binary_name: str) -> Optional[str]:
-        try:
-            # 'dotnet tool list -g' lists all installed tools
-            res = subprocess.run(
-                ["dotnet", "tool", "list", "-g"],
-                capture_output=True, text=True
-            )
-            if res.returncode == 0:
-                for line in res.stdout.splitlines():
-                    # Output: package.id        1.0.0       commands
-                    if line.lower().startswith(package_name.lower()):
-                        parts = line.split()
-                        if len(parts) >= 2:
-                            return parts[1]
-        except FileNotFoundError:
-            pass
-        return None
-
-    def get_latest_version(self, package_name: str) -> Optional[str]:
-        try:
-            # Query NuGet API
-            url = f"https://api.nuget.org/v3-flatcontainer/{package_name.lower()}/index.json"
-            resp = requests.get(url, timeout=3)
-            if resp.status_code == 200:
-                data = resp.json()
-                versions = data.get("versions", [])
-                if versions:
-                    return versions[-1] # List is sorted chronologically
-        except Exception:
-            pass
+        return _dotnet_installed().get(package_name.lower())
+
+    def latest_url(self, package_name: str) -> str:
+        # Query NuGet API
+        return f"https://api.nuget.org/v3-flatcontainer/{package_name.lower()}/index.json"
+
+    def parse_latest(self, body: bytes, package_name: str) -> Optional[str]:
+        versions = _json.loads(body).get("versions", [])
+        # The list is sorted oldest first; the newest without a pre-release
+        # label ("-preview.1", "-rc.2") is the latest stable.
+        for version in reversed(versions):
+            if "-" not in version:
+                return version
         return None
 
     def install(self, package_name: str) -> bool:
@@ -388,41 +626,28 @@ class DotnetManager:
         return res.returncode == 0
 
 
-class SdkmanManager:
+class SdkmanManager(HttpVersionLookup):
     """Java/JVM Environment Manager (SDKMAN!)"""
     # Note: SDKMAN is a shell function, so we must run it via bash -c with sourcing.
 
     SDK_INIT = "$HOME/.sdkman/bin/sdkman-init.sh"
 
     def _run_sdk(self, args: List[str]) -> subprocess.CompletedProcess:
-        # Helper to source sdkman before running command
+        # Helper to source sdkman before running command. Sourcing the init
+        # script is slow, so only 'install' goes through here; reads use the
+        # filesystem and the HTTP API.
         cmd = f"source {self.SDK_INIT} && sdk {' '.join(args)}"
         return subprocess.run(cmd, shell=True, executable="/bin/bash", capture_output=True, text=True)
 
     def get_installed_version(self, package_name: str, binary_name: str) -> Optional[str]:
-        # To check installed, we look at the 'current' output
-        try:
-            # Check filesystem directly to avoid slow shell spawning if possible
-            # ~/.sdkman/candidates/<<candidate>/current -> points to version
-            import os
-            home = os.path.expanduser("~")
-            link_path = os.path.join(home, ".sdkman", "candidates", package_name, "current")
-            if os.path.islink(link_path):
-                return os.path.basename(os.readlink(link_path))
-        except Exception:
-            pass
-        return None
+        return _sdkman_installed().get(package_name)
 
-    def get_latest_version(self, package_name: str) -> Optional[str]:
-        try:
-            # SDKMAN has an undocumented API for default versions
-            url = f"https://api.sdkman.io/2/candidates/{package_name}/default"
-            resp = requests.get(url, timeout=3)
-            if resp.status_code == 200:
-                return resp.text.strip()
-        except Exception:
-            pass
-        return None
+    def latest_url(self, package_name: str) -> str:
+        # SDKMAN has an undocumented API for default versions
+        return f"https://api.sdkman.io/2/candidates/{package_name}/default"
+
+    def parse_latest(self, body: bytes, package_name: str) -> Optional[str]:
+        return body.decode().strip()
 
     def install(self, package_name: str) -> bool:
         print(f" [sdkman] Installing {package_name}...")
@@ -435,7 +660,7 @@ class SdkmanManager:
 
 # --- Registry ---
 
-MANAGERS = {
+MANAGERS: Dict[str, PackageManager] = {
     "apt": AptManager(),
     "snap": SnapManager(),
     "pip": PipManager(),
@@ -448,6 +673,23 @@ MANAGERS = {
     "sdk": SdkmanManager(),
 }
 
+# The command each manager needs. Checking PATH once up front means a manager
+# that isn't installed costs nothing, instead of a failed exec per lookup.
+MANAGER_BINARIES = {
+    "apt": "apt",
+    "snap": "snap",
+    "pip": sys.executable,
+    "cargo": "cargo",
+    "npm": "npm",
+    "luarocks": "luarocks",
+    "gem": "gem",
+    "composer": "composer",
+    "dotnet": "dotnet",
+}
+AVAILABLE = {name: shutil.which(binary) is not None for name, binary in MANAGER_BINARIES.items()}
+# SDKMAN! is a shell function, so look for its init script instead.
+AVAILABLE["sdk"] = os.path.isfile(os.path.expanduser("~/.sdkman/bin/sdkman-init.sh"))
+
 @dataclass
 class Tool:
     name: str
@@ -506,26 +748,168 @@ TOOLS = [
 ]
 
 
+# --- Latest Version Cache ---
+
+class LatestVersionCache:
+    """
+    Persists latest-version lookups between runs.
+
+    Entries map "manager:package" to {"version": ..., "fetched_at": ...} and
+    are served while younger than the TTL, so a repeated 'status' only waits
+    on local checks.
+    """
+
+    def __init__(self, path: str, ttl: float = DEFAULT_CACHE_TTL):
+        self.path = path
+        self.ttl = ttl
+        self.read_enabled = True
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            if self._entries is None:
+                try:
+                    with open(self.path, "rb") as f:
+                        self._entries = json.load(f)
+                except (OSError, ValueError):
+                    self._entries = {}
+        return self._entries
+
+    def get(self, key: str) -> Optional[str]:
+        if not self.read_enabled:
+            return None
+        entry = self._load().get(key)
+        if entry and time.time() - entry["fetched_at"] < self.ttl:
+            version: str = entry["version"]
+            return version
+        return None
+
+    def put(self, key: str, version: str) -> None:
+        self._load()[key] = {"version": version, "fetched_at": time.time()}
+        self._dirty = True
+
+    def save(self) -> None:
+        """Writes the cache atomically, so a concurrent run never reads half a file."""
+        if not self._dirty:
+            return
+        directory = os.path.dirname(self.path)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with tempfile.NamedTemporaryFile("w", dir=directory, delete=False) as f:
+                json.dump(self._entries, f)
+            os.replace(f.name, self.path)
+            self._dirty = False
+        except OSError:
+            pass
+
+
+LATEST_CACHE = LatestVersionCache(LATEST_CACHE_PATH)
+
+_LookupFunc = TypeVar("_LookupFunc", bound=Callable[..., Any])
+
+
+def cached_latest(func: _LookupFunc) -> _LookupFunc:
+    """
+    Serves a latest-version lookup keyed on (manager, package_name) from
+    LATEST_CACHE while it is fresh. Works on plain and async functions.
+    """
+    if asyncio.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(manager: str, package_name: str, *args):
+            key = f"{manager}:{package_name}"
+            version = LATEST_CACHE.get(key)
+            if version is None:
+                version = await func(manager, package_name, *args)
+                if version:
+                    LATEST_CACHE.put(key, version)
+            return version
+        return cast(_LookupFunc, async_wrapper)
+
+    @functools.wraps(func)
+    def wrapper(manager: str, package_name: str, *args):
+        key = f"{manager}:{package_name}"
+        version = LATEST_CACHE.get(key)
+        if version is None:
+            version = func(manager, package_name, *args)
+            if version:
+                LATEST_CACHE.put(key, version)
+        return version
+    return cast(_LookupFunc, wrapper)
+
+
+@cached_latest
+def fetch_latest_version(manager: str, package_name: str) -> Optional[str]:
+    return MANAGERS[manager].get_latest_version(package_name)
+
+
+@cached_latest
+async def fetch_latest_version_async(manager: str, package_name: str,
+                                     session: "aiohttp.ClientSession") -> Optional[str]:
+    mgr = MANAGERS[manager]
+    if isinstance(mgr, HttpVersionLookup):
+        return await mgr.get_latest_version_async(session, package_name)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, mgr.get_latest_version, package_name)
+
+
 # --- Core Logic ---
 
-def get_tool_status(tool: Tool) -> Dict[str, Any]:
-    mgr = MANAGERS.get(tool.manager)
-    if not mgr:
-        return {"tool": tool, "current": "Err", "latest": "Err", "status": "Error"}
+INSTALLED_TABLES: Dict[str, Callable[[], Any]] = {
+    "snap": _snap_installed,
+    "cargo": _cargo_installed,
+    "npm": _npm_global_root,
+    "luarocks": _luarocks_installed,
+    "gem": _gem_installed,
+    "composer": _composer_installed,
+    "dotnet": _dotnet_installed,
+    "sdk": _sdkman_installed,
+}
 
-    current = mgr.get_installed_version(tool.name, tool.binary_name)
-    latest = mgr.get_latest_version(tool.name)
 
+def prefetch_local_versions(tools: List[Tool]) -> None:
+    """Runs the batched version queries for all tools before the per-tool fan-out."""
+    managers = {t.manager for t in tools if AVAILABLE.get(t.manager)}
+    with ThreadPoolExecutor() as executor:
+        apt_packages = [t.name for t in tools if t.manager == "apt"]
+        if apt_packages and "apt" in managers:
+            executor.submit(AptManager.bulk_query, apt_packages)
+        for manager in managers & INSTALLED_TABLES.keys():
+            executor.submit(INSTALLED_TABLES[manager])
+
+
+def _unknown_manager_status(tool: Tool) -> Dict[str, Any]:
+    return {"tool": tool, "current": "Err", "latest": "Err", "status_icon": "❓"}
+
+
+def _missing_manager_status(tool: Tool) -> Dict[str, Any]:
+    return {"tool": tool, "current": "Missing Manager", "latest": "Unknown", "status_icon": "❓"}
+
+
+def _normalize_version(version: str) -> "Version":
+    # Drop a Debian epoch ("1:") and any packaging revision or build suffix
+    # ("-1ubuntu2", "+b1", "~rc1"), leaving the upstream version.
+    return Version(_VERSION_SUFFIX_RE.split(version.split(":", 1)[-1], maxsplit=1)[0])
+
+
+def _is_outdated(current: str, latest: str) -> bool:
+    if current == latest:
+        return False
+    if Version is None:
+        return True
+    try:
+        return _normalize_version(current) < _normalize_version(latest)
+    except InvalidVersion:
+        return current != latest
+
+
+def _make_status(tool: Tool, current: Optional[str], latest: Optional[str]) -> Dict[str, Any]:
     # Determine status symbol
     status = "❌" # Not installed
     if current:
-        if latest and current != latest:
-            # Simple string comparison isn't perfect for semver but often sufficient
-            # Real semver parsing would go here
-            if current == latest:
-                status = "✅"
-            else:
-                status = "🔄" # Update available
+        if latest and _is_outdated(current, latest):
+            status = "🔄" # Update available
         else:
             status = "✅" # Installed, unknown latest, or match
 
@@ -537,7 +921,99 @@ def get_tool_status(tool: Tool) -> Dict[str, Any]:
     }
 
 
-def cmd_status():
+def get_tool_status(tool: Tool) -> Dict[str, Any]:
+    mgr = MANAGERS.get(tool.manager)
+    if not mgr:
+        return _unknown_manager_status(tool)
+    if not AVAILABLE.get(tool.manager):
+        return _missing_manager_status(tool)
+
+    current = mgr.get_installed_version(tool.name, tool.binary_name)
+    latest = fetch_latest_version(tool.manager, tool.name)
+    return _make_status(tool, current, latest)
+
+
+async def get_tool_status_async(tool: Tool, session: "aiohttp.ClientSession",
+                                local_ready: "asyncio.Future") -> Dict[str, Any]:
+    """
+    Looks up the installed and latest versions of a tool at the same time.
+
+    'local_ready' completes once prefetch_local_versions has run; lookups that
+    read its tables wait for it, registry requests do not.
+    """
+    mgr = MANAGERS.get(tool.manager)
+    if not mgr:
+        return _unknown_manager_status(tool)
+    if not AVAILABLE.get(tool.manager):
+        return _missing_manager_status(tool)
+
+    # Local lookups may block, so they run in the loop's thread pool; registry
+    # lookups share the session.
+    loop = asyncio.get_running_loop()
+
+    async def installed() -> Optional[str]:
+        await local_ready
+        return await loop.run_in_executor(None, mgr.get_installed_version, tool.name, tool.binary_name)
+
+    async def latest() -> Optional[str]:
+        # Apt's candidate versions come from the batched local query too.
+        if not isinstance(mgr, HttpVersionLookup):
+            await local_ready
+        return await fetch_latest_version_async(tool.manager, tool.name, session)
+
+    current, latest_version = await asyncio.gather(installed(), latest())
+    return _make_status(tool, current, latest_version)
+
+
+async def _collect_statuses_async(tools: List[Tool], description: str) -> List[Dict[str, Any]]:
+    import aiohttp
+    from rich.progress import track
+
+    loop = asyncio.get_running_loop()
+    # The batched local queries run while the registry requests are in flight.
+    local_ready = loop.run_in_executor(None, prefetch_local_versions, tools)
+
+    # One session for every registry: connections and TLS sessions to a host
+    # are reused, and all lookups are in flight at once.
+    connector = aiohttp.TCPConnector(limit=32, ttl_dns_cache=300)
+    timeout = aiohttp.ClientTimeout(total=3)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        tasks = [asyncio.ensure_future(get_tool_status_async(t, session, local_ready)) for t in tools]
+        for done in track(asyncio.as_completed(tasks), total=len(tasks), description=description):
+            await done
+    return [task.result() for task in tasks]
+
+
+def collect_statuses(tools: List[Tool], description: str) -> List[Dict[str, Any]]:
+    """Returns the status of each tool, in order, saving any new latest versions."""
+    if _import_aiohttp() is not None:
+        results = asyncio.run(_collect_statuses_async(tools, description))
+    else:
+        from rich.progress import track
+
+        # Create the session here so a failed import is not swallowed by a
+        # worker thread.
+        _get_session()
+        prefetch_local_versions(tools)
+        # The work is almost all waiting on processes and sockets, so every
+        # tool gets a worker; the bar advances as each one finishes, in any order.
+        with ThreadPoolExecutor(max_workers=min(len(tools), 32) or 1) as executor:
+            futures = {executor.submit(get_tool_status, t): i for i, t in enumerate(tools)}
+            by_index: Dict[int, Dict[str, Any]] = {}
+            for future in track(as_completed(futures), total=len(futures), description=description):
+                by_index[futures[future]] = future.result()
+        results = [by_index[i] for i in range(len(tools))]
+    LATEST_CACHE.save()
+    return results
+
+
+def cmd_status(use_cache: bool = True, cache_ttl: float = DEFAULT_CACHE_TTL):
+    from rich.console import Console
+    from rich.table import Table
+
+    LATEST_CACHE.read_enabled = use_cache
+    LATEST_CACHE.ttl = cache_ttl
+
     console = Console()
     table = Table(title="System Software Status")
 
@@ -548,8 +1024,7 @@ def cmd_status():
     table.add_column("Latest Version", style="yellow")
     table.add_column("Description")
 
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        results = list(track(executor.map(get_tool_status, TOOLS), total=len(TOOLS), description="Checking versions..."))
+    results = collect_statuses(TOOLS, "Checking versions...")
 
     for res in results:
         table.add_row(
@@ -562,20 +1037,27 @@ def cmd_status():
         )
 
     console.print(table)
-    console.print("\n[dim]Legend: ✅ Up-to-date  🔄 Update available  ❌ Not installed  ❓ Unknown Manager[/dim]")
-
+    console.print("\n[dim]Legend: ✅ Up-to-date  🔄 Update available  ❌ Not installed  ❓ Unknown or missing manager[/dim]")
 
 def cmd_install(exclude_list: List[str]):
+    from rich.console import Console
+
     console = Console()
     to_install = [t for t in TOOLS if t.name not in exclude_list]
 
     console.print(f"[bold]Starting installation for {len(to_install)} tools...[/bold]")
+    prefetch_local_versions(to_install)
 
+    # Missing tools, grouped by manager in the order the managers first appear.
+    pending: Dict[str, List[str]] = {}
     for tool in to_install:
         mgr = MANAGERS.get(tool.manager)
         if not mgr:
             console.print(f"[red]Error: No manager found for {tool.manager}[/red]")
             continue
+        if not AVAILABLE.get(tool.manager):
+            console.print(f"[red]Skipping {tool.name}: '{tool.manager}' is not installed[/red]")
+            continue
 
         current = mgr.get_installed_version(tool.name, tool.binary_name)
 
@@ -583,23 +1065,42 @@ def cmd_install(exclude_list: List[str]):
             console.print(f"[dim]Skipping {tool.name} (already installed: {current})[/dim]")
             continue
 
-        if mgr.install(tool.name):
-            console.print(f"[green]Successfully installed {tool.name}[/green]")
+        pending.setdefault(tool.manager, []).append(tool.name)
+
+    for manager, names in pending.items():
+        mgr = MANAGERS[manager]
+        # Managers that take several packages at once resolve dependencies and
+        # download once for the whole batch.
+        install_many = getattr(mgr, "install_many", None)
+        if len(names) > 1 and install_many is not None:
+            batches = [names]
         else:
-            console.print(f"[red]Failed to install {tool.name}[/red]")
+            batches = [[name] for name in names]
+
+        for batch in batches:
+            label = ", ".join(batch)
+            if len(batch) > 1 and install_many is not None:
+                ok = install_many(batch)
+            else:
+                ok = mgr.install(batch[0])
+            if ok:
+                console.print(f"[green]Successfully installed {label}[/green]")
+            else:
+                console.print(f"[red]Failed to install {label}[/red]")
 
 
 def cmd_update(exclude_list: List[str]):
+    from rich.console import Console
+
     console = Console()
     to_check = [t for t in TOOLS if t.name not in exclude_list]
     
     console.print(f"[bold]Checking for updates {len(to_check)} tools...[/bold]")
 
     # 1. Check statuses first (to find out what needs updating)
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        results = list(track(executor.map(get_tool_status, to_check), total=len(to_check), description="Scanning..."))
-        
-    updates_needed = [r for r in results if r["raw_status"] == "🔄"]
+    results = collect_statuses(to_check, "Scanning...")
+
+    updates_needed = [r for r in results if r["status_icon"] == "🔄"]
 
     if not updates_needed:
         console.print("[green|All tools are up to date! :tada:[/green]")
@@ -620,25 +1121,26 @@ def cmd_update(exclude_list: List[str]):
 
 
 def cmd_generate_docs():
-    with open(DOCS_PATH, "w") as f:
-        f.write("# System Provisioning & Ecosystem\n\n")
-        f.write("This file is **automatically generated** by `bin/system_manager.py`.\n")
-        f.write("Do not edit this file manually. Update the registry in the Python script instead.\n\n")
+    parts = [
+        "# System Provisioning & Ecosystem\n\n",
+        "This file is **automatically generated** by `bin/system_manager.py`.\n",
+        "Do not edit this file manually. Update the registry in the Python script instead.\n\n",
+    ]
+
+    # Group by context. The sort is stable, so tools keep their registry order
+    # within each context.
+    by_context = sorted(TOOLS, key=lambda t: t.context)
+    for ctx, ctx_tools in itertools.groupby(by_context, key=lambda t: t.context):
+        parts.append(f"## {ctx}\n\n")
+        parts.append("| Software | Source | Description | Binary |\n")
+        parts.append("| :--- | :--- | :--- | :--- |\n")
+        for t in ctx_tools:
+            bin_display = f"`{t.binary}`" if t.binary else "*(Same)*"
+            parts.append(f"| **`{t.name}`** | `{t.manager}` | {t.description} | {bin_display} |\n")
+        parts.append("\n")
 
-        # Group by context
-        contexts = sorted(list(set(t.context for t in TOOLS)))
-
-        for ctx in contexts:
-            f.write(f"## {ctx}\n\n")
-            f.write("| Software | Source | Description | Binary |\n")
-            f.write("| :--- | :--- | :--- | :--- |\n")
-
-            ctx_tools = [t for t in TOOLS if t.context == ctx]
-            for t in ctx_tools:
-                bin_display = f"`{t.binary}`" if t.binary else "*(Same)*"
-                f.write(f"| **`{t.name}`** | `{t.manager}` | {t.description} | {bin_display} |\n")
-
-            f.write("\n")
+    with open(DOCS_PATH, "w") as f:
+        f.write("".join(parts))
 
     print(f"Successfully generated {DOCS_PATH}")
 
@@ -650,7 +1152,11 @@ def main():
     subparsers = parser.add_subparsers(dest="command")
 
     # Status Command
-    subparsers.add_parser("status", help="Check versions of all tools")
+    status_parser = subparsers.add_parser("status", help="Check versions of all tools")
+    status_parser.add_argument("--no-cache", action="store_true",
+                               help="Query every registry instead of reusing cached latest versions")
+    status_parser.add_argument("--cache-ttl", type=float, default=DEFAULT_CACHE_TTL,
+                               help="Seconds a cached latest version stays valid (default: %(default)s)")
 
     # Install Command
     install_parser = subparsers.add_parser("install", help="Install missing tools")
@@ -661,16 +1167,32 @@ def main():
 
     args = parser.parse_args()
 
-    if args.command == "status":
-        cmd_status()
-    elif args.command == "install":
-        cmd_install(args.exclude)
-    elif args.command == "update":
-        cmd_update(args.exclude)
-    elif args.command == "generate-docs":
-        cmd_generate_docs()
-    else:
-        parser.print_help()
+    if args.command in ("status", "install", "update"):
+        missing = [m for m in REQUIRED_MODULES if importlib.util.find_spec(m) is None]
+        if missing:
+            print("Error: 'rich' and 'requests' libraries are required.")
+            print("pip install rich requests")
+            sys.exit(1)
+
+    # The parse is requested from a worker thread, and forking a process that
+    # runs threads is unsafe, so the worker comes from a fork server instead.
+    # No process is started unless a large database is actually parsed.
+    global _parse_pool
+    context = multiprocessing.get_context(
+        "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    )
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as _parse_pool:
+        if args.command == "status":
+            cmd_status(use_cache=not args.no_cache, cache_ttl=args.cache_ttl)
+        elif args.command == "install":
+            cmd_install(args.exclude)
+        elif args.command == "update":
+            cmd_update(args.exclude)
+        elif args.command == "generate-docs":
+            cmd_generate_docs()
+        else:
+            parser.print_help()
+    _parse_pool = None
 
 
 if __name__ == "__main__":